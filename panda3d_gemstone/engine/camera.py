@@ -30,7 +30,7 @@ from panda3d_gemstone.framework.configurable import Configurable
 from panda3d_gemstone.framework.runnable import Runnable
 from panda3d_gemstone.framework.singleton import Singleton
 from panda3d_gemstone.framework.service import Service, Command
-from panda3d_gemstone.framework.controller import ControllerChainMixIn
+from panda3d_gemstone.framework.controller import ControllerChainMixIn, update_controller_chain
 from panda3d_gemstone.controllers.basic import FixedController
 
 class Camera(Configurable, Runnable):
@@ -286,9 +286,9 @@ class FixedCamera(Camera):
         Performs camera tick operations once per frame
         """
 
-        np = await self.__controller.update(camera, dt)
-        self.camera.set_quat(np.get_quat())
-        self.camera.set_fluid_pos(np.get_pos())
+        transform = await update_controller_chain(self.__controller, camera, dt)
+        self.camera.set_quat(transform.get_quat())
+        self.camera.set_fluid_pos(transform.get_pos())
 
 class FollowCamera(Camera, ControllerChainMixIn):
     """
@@ -365,7 +365,7 @@ class FollowCamera(Camera, ControllerChainMixIn):
 
         result = Camera.deactivate(self)
         if result:
-            self.call_controller_chain(self.controller, 'aeactivate')
+            self.call_controller_chain(self.controller, 'deactivate')
 
         return result
 
@@ -379,7 +379,7 @@ class FollowCamera(Camera, ControllerChainMixIn):
         if self.__controller is None:
             return
 
-        np = await self.__controller.update(self.__target, dt)
+        transform = await update_controller_chain(self.__controller, self.__target, dt)
         if self.__mouse_controller and self.__mouse_rotating_handling:
             should_lerp = self.__target_pos.almost_equal(self.__target.get_pos()) or self.__target_hpr.almost_equal(self.__target.get_hpr())
             if should_lerp:
@@ -387,8 +387,8 @@ class FollowCamera(Camera, ControllerChainMixIn):
             else:
                 self.__mouse_controller.set_mode(MouseRotationController.SAVE_ROTATION)
 
-        look_at = np.get_quat()
-        position = np.get_pos()
+        look_at = transform.get_quat()
+        position = transform.get_pos()
 
         if camera:
             camera.set_quat(look_at)
@@ -396,7 +396,8 @@ class FollowCamera(Camera, ControllerChainMixIn):
 
         if self.__update_target_look_at:
             if self.__mouse_controller.dragging:
-                if not self.__target.get_quat().almost_equal(look_at):
+                # Compare by dot product so q and -q count as the same orientation
+                if abs(self.__target.get_quat().dot(look_at)) < 1.0 - 1e-6:
                     self.__mouse_controller._reset_position()
                     self.__target.set_quat(look_at)
             else:
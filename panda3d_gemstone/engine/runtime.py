@@ -88,6 +88,10 @@ def has_thirdparty(import_string) -> bool:
     the environment
     """
 
+    # Modules already imported skip the import machinery
+    if import_string in sys.modules:
+        return True
+
     import importlib
     found = False
     try:
@@ -44,16 +44,12 @@ class MalformedShaderLoadRequest(ShaderError):
     Fired when a malformed load_shader request is made
     """
 
-def __kwargs_to_string(self, kwargs, sep=',') -> str:
+def __kwargs_to_string(kwargs: dict, sep: str = ',') -> str:
     """
     Returns a list of keyword arguments as a string
     """
 
-    output = ''
-    for kwarg in kwargs:
-        output += '%s: %s%s ' % (kwarg, kwargs[kwarg], sep)
-
-    return output
+    return ' '.join('%s: %s%s' % (key, value, sep) for key, value in kwargs.items())
 
 __extension_map = {
     'glsl': Shader.SL_GLSL,
@@ -99,68 +95,84 @@ def shader_file_supported(shader_path: str) -> bool:
 
     return get_shader_language(shader_path) != None
 
-def __matching_shader_languages(shader_paths: list) -> bool:
+def __matching_shader_languages(language: object, shader_paths: tuple) -> bool:
     """
-    Returns true if all the shader paths provided match the same language
+    Returns true if all the shader paths provided match the language
     """
 
-    last_lang = None
-    matching = True
-    for shader_path in shader_paths:
-        if shader_path is None:
-            continue
-            
-        shader_lang = get_shader_language(shader_path)
-        if last_lang != None and shader_lang != last_lang:
-            matching = False
-            break
-        last_lang = shader_lang
-    
-    return matching
+    return all(get_shader_language(path) == language for path in shader_paths if path is not None)
 
-def __convert_path_list_filename_list(shader_paths: list) -> list:
+def __prepare_shader_paths(vertex: str, fragment: str, geometry: str, tess_control: str, tess_evaluation: str) -> tuple:
     """
-    Converts a list of string paths to a list of Panda3D Filename objects
+    Returns the provided shader stages as a tuple of Panda3D Filename objects
     """
 
-    converted = []
-    for path in shader_paths:
-        if path is None:
-            continue
-        
-        converted.append(Filename(path))
+    if fragment is not None and geometry is None and tess_control is None and tess_evaluation is None:
+        return (Filename(vertex), Filename(fragment))
 
-    return converted
+    return tuple(Filename(path) for path in (vertex, fragment, geometry, tess_control, tess_evaluation) if path is not None)
 
-def make_shader(language: object, vertex: str, fragment: str, geometry: str = None, tess_control: str = None, tess_evaluation: str = None) -> object:
+def __resolve_load_language(request: str, vertex: str, fragment: str, geometry: str, tess_control: str, tess_evaluation: str) -> object:
     """
-    Creates a shader instance using string bodies instead of files
+    Verifies the shader files of a load request and returns their
+    Panda3D language identifier
     """
 
-    if not is_supported_language(language):
-        raise ShaderCompileError('Failed to make shader. Language (%s) is not supported' % str(language))
+    # Verify the shader language is supported
+    shader_language = get_shader_language(vertex)
+    if shader_language is None:
+        raise MalformedShaderLoadRequest('Invalid %s request. Shader extension %s is not supported' % (request, get_file_extension(vertex)))
+
+    # Common vertex and fragment only request
+    if fragment is not None and geometry is None and tess_control is None and tess_evaluation is None:
+        if get_shader_language(fragment) != shader_language:
+            raise MalformedShaderLoadRequest('Invalid %s request. Not all shader files are the same language. Shaders: [%s, %s]' % (
+                request, vertex, fragment))
 
-    paths = [vertex, fragment, geometry, tess_control, tess_evaluation]
-    paths = __convert_path_list_filename_list(paths)
-    shader = Shader.make(language, *paths)
+        return shader_language
+
+    # Verify all the remaining shader files match the vertex language
+    paths = (vertex, fragment, geometry, tess_control, tess_evaluation)
+    if not __matching_shader_languages(shader_language, paths[1:]):
+        raise MalformedShaderLoadRequest('Invalid %s request. Not all shader files are the same language. Shaders: [%s]' % (
+            request, ', '.join(path for path in paths if path is not None)))
+
+    return shader_language
+
+def __make_or_load(func_name: str, description: str, language: object, vertex: str, fragment: str, geometry: str, tess_control: str, tess_evaluation: str) -> object:
+    """
+    Creates or loads a shader using the requested Panda3D Shader
+    constructor and verifies the result
+    """
+
+    paths = __prepare_shader_paths(vertex, fragment, geometry, tess_control, tess_evaluation)
+    shader = getattr(Shader, func_name)(language, *paths)
 
     # Verify no errors have occured
     if not shader or shader.get_error_flag():
-        __shader_notify.warning('Failed to make shader. An error occured while compiling.')
+        __shader_notify.warning('Failed to %s. An error occured while compiling.' % description)
 
     return shader
 
-def make_compute_shader(language: object, vertex: str, fragment: str, geometry: str = None, tess_control: str = None, tess_evaluation: str = None) -> object:
+def make_shader(language: object, vertex: str, fragment: str, geometry: str = None, tess_control: str = None, tess_evaluation: str = None) -> object:
     """
-    Creates a compute shader instance using string bodies instead of files
+    Creates a shader instance using string bodies instead of files
     """
 
     if not is_supported_language(language):
         raise ShaderCompileError('Failed to make shader. Language (%s) is not supported' % str(language))
 
-    paths = [vertex, fragment, geometry, tess_control, tess_evaluation]
-    paths = __convert_path_list_filename_list(paths)
-    shader = Shader.make_compute(language, *paths)
+    return __make_or_load('make', 'make shader', language, vertex, fragment, geometry, tess_control, tess_evaluation)
+
+def make_compute_shader(language: object, compute: str) -> object:
+    """
+    Creates a compute shader instance using a string body instead of a file
+    """
+
+    if not is_supported_language(language):
+        raise ShaderCompileError('Failed to make shader. Language (%s) is not supported' % str(language))
+
+    shader = Shader.make_compute(language, compute)
 
     # Verify no errors have occured
     if not shader or shader.get_error_flag():
@@ -173,42 +185,20 @@ def load_shader(vertex: str, fragment: str, geometry: str = None, tess_control:
     Loads a shader from the application's file system using the various shader program files.
     """
 
-    # Verify the shader language is supported
-    if not shader_file_supported(vertex):
-        raise MalformedShaderLoadRequest('Invalid load request. Shader extension %s is not supported' % (get_file_extension(vertex)))
-
-    # Verify all the requested shader files are the same language
-    paths = [vertex, fragment, geometry, tess_control, tess_evaluation]
-    if not __matching_shader_languages(paths):
-        raise MalformedShaderLoadRequest('Invalid load request. Not all shader files are the same language. Shaders: [%s]' % (', '.join(paths)))
+    language = __resolve_load_language('load', vertex, fragment, geometry, tess_control, tess_evaluation)
+    return __make_or_load('load', 'load shader', language, vertex, fragment, geometry, tess_control, tess_evaluation)
 
-    shader_language = get_shader_language(vertex)
-    paths = __convert_path_list_filename_list(paths)
-    shader = Shader.load(shader_language, *paths)
-
-    # Verify no errors have occured
-    if not shader or shader.get_error_flag():
-        __shader_notify.warning('Failed to load shader. An error occured while compiling.')
-
-    return shader
-
-def load_compute_shader(vertex: str, fragment: str, geometry: str = None, tess_control: str = None, tess_evaluation: str = None) -> object:
+def load_compute_shader(compute: str) -> object:
     """
-    Loads a compute shader from the application's file system using the various shader program files.
+    Loads a compute shader from the application's file system using the compute shader program file.
     """
 
     # Verify the shader language is supported
-    if not shader_file_supported(vertex):
-        raise MalformedShaderLoadRequest('Invalid load compute request. Shader extension %s is not supported' % (get_file_extension(vertex)))
+    shader_language = get_shader_language(compute)
+    if shader_language is None:
+        raise MalformedShaderLoadRequest('Invalid load compute request. Shader extension %s is not supported' % get_file_extension(compute))
 
-    # Verify all the requested shader files are the same language
-    paths = [vertex, fragment, geometry, tess_control, tess_evaluation]
-    if not __matching_shader_languages(paths):
-        raise MalformedShaderLoadRequest('Invalid load compute request. Not all shader files are the same language. Shaders: [%s]' % (', '.join(paths)))
-
-    shader_language = get_shader_language(vertex)
-    paths = __convert_path_list_filename_list(paths)
-    shader = Shader.load_compute(shader_language, *paths, **kwargs)
+    shader = Shader.load_compute(shader_language, Filename(compute))
 
     # Verify no errors have occured
     if not shader or shader.get_error_flag():
@@ -23,7 +23,8 @@ SOFTWARE.
 """
 
 from panda3d.core import NodePath, CardMaker, Texture
-from panda3d.core import TransparencyAttrib
+from panda3d.core import TransparencyAttrib, DepthWriteAttrib, TextureAttrib
+from panda3d.core import RenderState
 
 from panda3d_gemstone.engine import runtime
 from panda3d_gemstone.framework.internal_object import InternalObject
@@ -38,17 +39,20 @@ class GeometryShadow(NodePath, InternalObject):
         card_maker = CardMaker(self.__class__.__name__)
         card_maker.set_frame(-0.5 * scale_x, 0.5 * scale_x, -0.5 * scale_y, 0.5 * scale_y)
         self.assign(obj.attach_new_node(card_maker.generate()))
-        self.set_p(-90)
+
+        # Build the shadow's render state in a single pass
+        attribs = [
+            TransparencyAttrib.make(TransparencyAttrib.MAlpha),
+            DepthWriteAttrib.make(DepthWriteAttrib.M_off)]
 
         try:
             texture = runtime.loader.load_texture(texture_path)
             if texture:
-                self.set_texture(texture)
+                attribs.append(TextureAttrib.make(texture))
             else:
                 self.notify.error('%s: Failed to read texture file "%s"' % (self.__class__.__name__, texture_path))
         except IOError:
             self.notify.error('%s: Failed to read texture file "%s"' % (self.__class__.__name__, texture_path))
 
-        self.set_z(height)
-        self.set_transparency(TransparencyAttrib.MAlpha)
-        self.set_depth_write(False)
\ No newline at end of file
+        self.set_state(RenderState.make(*attribs))
+        self.set_pos_hpr(0, 0, height, 0, -90, 0)
@@ -23,6 +23,7 @@ SOFTWARE.
 """
 
 import builtins
+import sys
 
 from direct.showbase.ShowBase import ShowBase
 
@@ -78,6 +79,8 @@ class ApplicationShowBase(GemstoneShowBase):
     notify = logging.get_notify_category('showbase')
 
     def __init__(self, *args, **kwargs):
+        self.__window_props = WindowProperties()
+        self.__aa_configured = False
         super().__init__(*args, **kwargs)
         self.setup()
 
@@ -112,6 +115,17 @@ class ApplicationShowBase(GemstoneShowBase):
         runtime.loader = self.loader
         runtime.cam = self.cam
         runtime.camera = self.camera
+
+    def __get_window_props(self) -> WindowProperties:
+        """
+        Returns the cleared scratch WindowProperties instance used
+        for window property requests
+        """
+
+        props = self.__window_props
+        props.clear()
+
+        return props
     
     def set_window_title(self, window_title: str) -> None:
         """
@@ -122,7 +136,7 @@ class ApplicationShowBase(GemstoneShowBase):
         if not self.win:
             return
 
-        props = WindowProperties()
+        props = self.__get_window_props()
         props.set_title(window_title)
         self.win.request_properties(props)
 
@@ -134,7 +148,7 @@ class ApplicationShowBase(GemstoneShowBase):
         if not self.win:
             return
 
-        props = WindowProperties()
+        props = self.__get_window_props()
         props.set_origin(*origin)
         props.set_size(*size)
         self.win.request_properties(props)
@@ -177,12 +191,15 @@ class ApplicationShowBase(GemstoneShowBase):
         Sets the graphics library based antialiasing state
         """
 
-        if not prc.get_prc_bool('framebuffer-mutlisample', False):
-            prc.set_prc_value('framebuffer-multisample', True)
+        if not self.__aa_configured:
+            if not prc.get_prc_bool('framebuffer-multisample', False):
+                prc.set_prc_value('framebuffer-multisample', True)
+
+            if prc.get_prc_int('multisamples', 0) < 2:
+                self.notify.warning('Multisamples not set. Defaulting to a value of 2')
+                prc.set_prc_value('multisamples', 2)
 
-        if prc.get_prc_int('multisamples', 0) < 2:
-            self.notify.warning('Multisamples not set. Defaulting to a value of 2')
-            prc.set_prc_value('multisamples', 2)
+            self.__aa_configured = True
 
         if antialias:
             self.render.set_antialias(AntialiasAttrib.MAuto)
@@ -27,6 +27,7 @@ from panda3d_gemstone.engine.model import StaticModel
 
 from panda3d_gemstone.framework.runnable import Runnable
 
+_CAMERA_MOVE_THRESHOLD = 1e-6
 
 class Skybox(StaticModel, Runnable):
     """
@@ -36,6 +37,9 @@ class Skybox(StaticModel, Runnable):
     def __init__(self, config_path: str):
         StaticModel.__init__(self, config_path)
         Runnable.__init__(self, 15)
+        self.__last_camera_pos = None
+        self.__base = None
+        self.__camera = None
         
         self.set_bin('background', 0)
         self.set_depth_test(False)
@@ -56,6 +60,9 @@ class Skybox(StaticModel, Runnable):
         state with the Panda3D game window
         """
 
+        self.__base = runtime.base
+        self.__camera = runtime.camera
+
         active = Runnable.activate(self)
         if active and runtime.base.win:
             runtime.base.win.set_clear_color_active(False)
@@ -70,13 +77,21 @@ class Skybox(StaticModel, Runnable):
         if active and runtime.base.win:
             runtime.base.win.set_clear_color_active(True)
 
-    async def tick(self, dt: float) -> int:
+        self.__base = None
+        self.__camera = None
+
+    def tick(self, dt: float) -> None:
         """
         Custom tick handler. Updates the position of the skybox to match
         the position of the users camera
         """
 
-        camera = runtime.camera
-        if runtime.base.is_oobe():
-            camera = runtime.base.oobeCamera
-        self.set_pos(camera.get_pos(self.get_parent()))
\ No newline at end of file
+        base = self.__base
+        camera = base.oobeCamera if getattr(base, 'oobeMode', False) else self.__camera
+        camera_pos = camera.get_pos(self.get_parent())
+        last_pos = self.__last_camera_pos
+        if last_pos is not None and (camera_pos - last_pos).length_squared() < _CAMERA_MOVE_THRESHOLD:
+            return
+
+        self.set_pos(camera_pos)
+        self.__last_camera_pos = camera_pos
\ No newline at end of file
@@ -29,11 +29,132 @@ from panda3d_gemstone.world.entity import Entity
 from panda3d.core import ShaderTerrainMesh, GeoMipTerrain, Filename
 from panda3d.core import Vec3
 
+import functools
+
+_TERRAIN_KEYS_CACHE = {}
+_IGNORED_GETTERS = frozenset(['get_class_type'])
+
+@functools.lru_cache(maxsize=512)
+def _get_attribute_key(key: str) -> str:
+    """
+    Returns the native attribute name for a getter/setter key
+    """
+
+    return key.replace('get_', '').replace('set_', '')
+
+@functools.lru_cache(maxsize=64)
+def _parse_scale_tuple(scale: str) -> tuple:
+    """
+    Parses a comma separated scale string into a tuple of floats
+    """
+
+    return tuple(map(float, scale.split(',')))
+
+def _make_terrain_applier(terrain_cls: type, key: str) -> object:
+    """
+    Resolves the configuration key against the native terrain type
+    into a applier callable taking the terrain instance and value.
+    Returns None if the terrain type has no matching attribute
+    """
+
+    method = getattr(terrain_cls, key, None)
+    if callable(method):
+        def apply_method(terrain: object, value: object) -> None:
+            if isinstance(value, tuple):
+                method(terrain, *value)
+            else:
+                method(terrain, value)
+
+        return apply_method
+
+    attr_key = key[4:] if key.startswith('set_') else key
+    if hasattr(terrain_cls, attr_key):
+        def apply_attribute(terrain: object, value: object) -> None:
+            setattr(terrain, attr_key, value)
+
+        return apply_attribute
+
+    return None
+
+def _get_terrain_keys(terrain: object) -> frozenset:
+    """
+    Returns the cached attribute names of the native terrain's type
+    """
+
+    terrain_cls = terrain.__class__
+    keys = _TERRAIN_KEYS_CACHE.get(terrain_cls)
+    if keys is None:
+        keys = frozenset(dir(terrain))
+        _TERRAIN_KEYS_CACHE[terrain_cls] = keys
+
+    return keys
+
+def _has_attribute(terrain: object, key: str) -> bool:
+    """
+    Returns true if the terrain has a attribute from the getter/setter key
+    """
+
+    keys = _get_terrain_keys(terrain)
+    return key in keys or _get_attribute_key(key) in keys
+
+def _valid_get(key: str) -> bool:
+    """
+    Returns true if the requested attribute is a valid getter
+    """
+
+    return key.startswith('get_') and key not in _IGNORED_GETTERS
+
 class TerrainBase(Entity):
     """
     Base class of all Panda3D terrain objects
     """
 
+    _SCHEMA_CACHE = {}
+    _native_terrain_cls = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        native_cls = cls.__dict__.get('_native_terrain_cls')
+        if native_cls is None:
+            return
+
+        def make_getter(key: str) -> object:
+            def getter(self) -> object:
+                return self.__get_value(key)
+
+            getter.__name__ = key
+            return getter
+
+        def make_setter(key: str) -> object:
+            def setter(self, *args) -> None:
+                self.__set_value(key, args[0] if len(args) == 1 else args)
+
+            setter.__name__ = key
+            return setter
+
+        # Generate explicit delegates for the native terrain's getters and
+        # setters so they resolve without entering __getattr__
+        for key in dir(native_cls):
+            if key.startswith('_'):
+                continue
+
+            if key.startswith('get_') or key.startswith('set_'):
+                keys = (key,)
+            elif not callable(getattr(native_cls, key, None)):
+                keys = ('get_%s' % key, 'set_%s' % key)
+            else:
+                continue
+
+            for delegate_key in keys:
+                if hasattr(cls, delegate_key) or delegate_key in _IGNORED_GETTERS:
+                    continue
+
+                if delegate_key.startswith('get_'):
+                    setattr(cls, delegate_key, make_getter(delegate_key))
+                else:
+                    setattr(cls, delegate_key, make_setter(delegate_key))
+
     def __init__(self, config_path: str, terrain: object = None):
         self.__texture = None
         self.__heightfield_texture = None
@@ -58,22 +179,30 @@ class TerrainBase(Entity):
         """
 
         # Configure terrain
-        for value_key in self.__values:
-            if hasattr(self.__terrain, value_key):
-                value = self.__values[value_key]
-                func = getattr(self.__terrain, value_key)
-                if func and False:
-                    if isinstance(value, tuple):
-                        func(*value)
-                    else:
-                        func(value)
-                else:
-                    attr = getattr(self.__terrain, value_key.replace('set_', ''))
-                    if attr:
-                        attr = value
-                    else:
-                        self.notify.warning('%s does not have attribute %s!' % (
-                            self.__terrain.__class__.__name__, value_key))   
+        terrain = self.__terrain
+        keys, appliers = self.__get_schema(terrain.__class__, tuple(self.__values))
+        for key, applier, value in zip(keys, appliers, self.__values.values()):
+            if applier is not None:
+                applier(terrain, value)
+            else:
+                self.notify.warning('%s does not have attribute %s!' % (
+                    terrain.__class__.__name__, key))
+
+    @staticmethod
+    def __get_schema(terrain_cls: type, keys: tuple) -> tuple:
+        """
+        Returns the cached (keys, appliers) schema for the native
+        terrain type and configured key set
+        """
+
+        schema_key = (terrain_cls, keys)
+        schema = TerrainBase._SCHEMA_CACHE.get(schema_key)
+        if schema is None:
+            appliers = tuple(_make_terrain_applier(terrain_cls, key) for key in keys)
+            schema = (keys, appliers)
+            TerrainBase._SCHEMA_CACHE[schema_key] = schema
+
+        return schema
 
     def set_heightfield(self, heightfield_path: str) -> None:
         """
@@ -109,12 +238,10 @@ class TerrainBase(Entity):
         Sets the terrain's scale value
         """
 
-        inputs = []
         if isinstance(scale, tuple):
             inputs = scale
         else:
-            for num in scale.split(','):
-                inputs.append(float(num))
+            inputs = _parse_scale_tuple(scale)
 
         self.__terrain_scale = Vec3(*inputs)
 
@@ -142,35 +269,21 @@ class TerrainBase(Entity):
     def __getattr__(self, key: str) -> object:
         """
         Custom attribute getter for passing along function
-        calls to the native Panda3D terrain object
+        calls to the native Panda3D terrain object. Subclasses declaring
+        a native terrain class resolve most getters and setters through
+        generated delegates and only fall back to this for unknown keys
         """
 
         result = None
-
-        def has_attribute(obj: object, key: str) -> bool:
-            """
-            Returns true if the object has a attribute from the getter/setter key
-            """
-
-            attrib_key = key.replace('get_', '').replace('set_', '')
-            return hasattr(obj, key) or hasattr(obj, attrib_key)
-
-        def valid_get(obj: object, key: str) -> bool:
-            """
-            Returns true if the requested attribute is a valid getter
-            """
-
-            ignored = ['get_class_type']
-            return key.startswith('get_') and key not in ignored
-        
         if isinstance(key, str):
-            if has_attribute(self.__terrain, key):
-                if valid_get(self.__terrain, key):
+            terrain = self.__terrain
+            if _has_attribute(terrain, key):
+                if _valid_get(key):
                     result = lambda: self.__get_value(key)
                 elif key.startswith('set_'):
                     result = lambda x: self.__set_value(key, x)
                 else:
-                    return getattr(self.__terrain, key)
+                    return getattr(terrain, key)
 
         if result is None:
             raise AttributeError('%s instance does not have attribute %s' % (
@@ -185,6 +298,8 @@ class CPUTerrain(TerrainBase):
     node object
     """
 
+    _native_terrain_cls = GeoMipTerrain
+
     def __init__(self, config_path: str):
         self.__terrain_texture = None
         super().__init__(config_path, GeoMipTerrain(self.__class__.__name__))
@@ -216,6 +331,8 @@ class GPUTerrain(TerrainBase):
     node object
     """
 
+    _native_terrain_cls = ShaderTerrainMesh
+
     def __init__(self, config_path: str):
         self.__terrain_texture = None
         self.__target_triangle_width = 10
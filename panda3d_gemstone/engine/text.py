@@ -22,14 +22,79 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from panda3d.core import NodePath, TextNode
-from panda3d.core import Texture
+import weakref
+import collections
+
+from panda3d.core import NodePath, TextNode, Vec3, Vec4
+from panda3d.core import Texture, DynamicTextFont
 
 from panda3d_gemstone.framework.configurable import Configurable
 from panda3d_gemstone.framework.internal_object import InternalObject
 from panda3d_gemstone.framework.resource import Resource, ExportProperty
 
 from panda3d_gemstone.engine.model_utilities import get_model_texture_objects
+from panda3d_gemstone.engine import prc
+
+_FONT_CACHE = weakref.WeakValueDictionary()
+_GLYPH_ATLAS_PAGE_SIZE = 2048
+_TEXT_GEOM_CACHE_SIZE = 8
+
+_ALIGN_STR_MAP = {
+    'left': TextNode.ALeft,
+    'right': TextNode.ARight,
+    'center': TextNode.ACenter
+}
+
+_ALIGN_NAME_MAP = {
+    TextNode.ALeft: 'left',
+    TextNode.ARight: 'right',
+    TextNode.ACenter: 'center'
+}
+
+def _resolve_alignment(align: object) -> object:
+    """
+    Returns the TextNode alignment for a alignment name or constant.
+    Returns NoneType if the alignment is invalid
+    """
+
+    if isinstance(align, str):
+        return _ALIGN_STR_MAP.get(align.lower())
+
+    return align if align in _ALIGN_NAME_MAP else None
+
+def get_font(font_path: str, force_export: bool = False) -> object:
+    """
+    Returns the Font resource for the requested path. Fonts are shared
+    between text objects for as long as one of them holds a reference
+    """
+
+    key = (font_path, force_export)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = Font(font_path, force_export)
+        _FONT_CACHE[key] = font
+
+        if prc.get_prc_bool('gs-text-glyph-atlas', False):
+            configure_glyph_atlas(font.get_text_font())
+
+    return font
+
+def configure_glyph_atlas(text_font: object, page_size: int = _GLYPH_ATLAS_PAGE_SIZE) -> bool:
+    """
+    Configures a dynamic text font to rasterize its glyphs into large
+    shared atlas pages, reducing the number of glyph textures every
+    TextNode using the font has to switch between. Returns true if the
+    font supports the atlas
+    """
+
+    if not isinstance(text_font, DynamicTextFont):
+        return False
+
+    if text_font.get_page_x_size() != page_size or text_font.get_page_y_size() != page_size:
+        text_font.set_page_size(page_size, page_size)
+        text_font.clear()
+
+    return True
 
 class Text(NodePath, Configurable, InternalObject):
     """
@@ -37,19 +102,16 @@ class Text(NodePath, Configurable, InternalObject):
     for displaying text in the scene graph
     """
 
-    Alignment = {
-        'left': TextNode.ALeft,
-        'right': TextNode.ARight,
-        'center': TextNode.ACenter,
-        TextNode.ALeft: TextNode.ALeft,
-        TextNode.ARight: TextNode.ARight,
-        TextNode.ACenter: TextNode.ACenter
-    }
+    Alignment = _ALIGN_STR_MAP
 
     def __init__(self, config_path: str, section: str = 'Configuration'):
         NodePath.__init__(self, '')
         Configurable.__init__(self, config_path, section)
 
+        self.__font = None
+        self.__last_text = None
+        self.__last_color = None
+        self.__last_shadow_offset = None
         self.__text_node = TextNode('TextBillboard')
         self.assign(self.attach_new_node(self.__text_node))
         self.set_billboard_point_eye()
@@ -95,11 +157,16 @@ class Text(NodePath, Configurable, InternalObject):
 
         return self.__text_node.get_text_color()
 
-    def set_color(self, *color) -> None:
+    def set_color(self, *color, force: bool = False) -> None:
         """
-        Sets this Text object's text color
+        Sets this Text object's text color. Unchanged colors are ignored
+        unless forced
         """
 
+        if not force and color == self.__last_color:
+            return
+
+        self.__last_color = color
         self.__text_node.set_text_color(*color)
 
     def get_shadow_offset(self) -> object:
@@ -109,12 +176,17 @@ class Text(NodePath, Configurable, InternalObject):
 
         return self.__text_node.get_shadow()
 
-    def set_shadow_offset(self, *offset) -> None:
+    def set_shadow_offset(self, *offset, force: bool = False) -> None:
         """
-        Sets thie Text object's shadow offset
+        Sets thie Text object's shadow offset. Unchanged offsets are
+        ignored unless forced
         """
 
-        self.__text_node.set_shadow_color(*offset)
+        if not force and offset == self.__last_shadow_offset:
+            return
+
+        self.__last_shadow_offset = offset
+        self.__text_node.set_shadow(*offset)
 
     def clear_shadow_color(self) -> None:
         """
@@ -138,19 +210,25 @@ class Text(NodePath, Configurable, InternalObject):
         assert font_path != None
         assert font_path != ''
 
-        font = Font(font_path)
+        font = get_font(font_path)
         if not font:
             self.notify.warning('Failed to set font. Could not open font "%s"' % font_path)
             return
         
+        self.__font = font
         text_font = font.get_text_font()
         self.__text_node.set_font(text_font)
 
-    def set_text(self, text) -> None:
+    def set_text(self, text, force: bool = False) -> None:
         """
-        Sets the text object's displayed text
+        Sets the text object's displayed text. Unchanged text is ignored
+        unless forced
         """
 
+        if not force and text == self.__last_text:
+            return
+
+        self.__last_text = text
         self.__text_node.set_text(text)
 
     def get_text(self) -> str:
@@ -172,23 +250,19 @@ class Text(NodePath, Configurable, InternalObject):
         Returns the text alignment name from instance
         """
 
-        for k, v in list(Text.Alignment.items()):
-            if v == align and isinstance(k, str):
-                return k
-        
+        return _ALIGN_NAME_MAP.get(align)
+
     def set_text_alignment(self, align: object) -> None:
         """
         Sets the text object's alignment property
         """
 
-        if isinstance(align, str):
-            align = align.lower()
-
-        if not align in Text.Alignment:
+        alignment = _resolve_alignment(align)
+        if alignment is None:
             self.notify.warning('Failed to set alignment. Invalid alignement "%s" specified' % align)
             return
         
-        self.__text_node.set_align(Text.Alignment[align])
+        self.__text_node.set_align(alignment)
 
 class Font(Resource, InternalObject):
     """
@@ -302,22 +376,22 @@ class Font(Resource, InternalObject):
 
 class TextBillboard(Configurable, InternalObject):
     """
-    Represents a billboard text node in the Gemstone framework
+    Represents a billboard text node in the Gemstone framework. Generated
+    text geometry is cached per font and text value so repeated strings
+    skip the TextNode layout pass
     """
 
-    Alignment = {
-        'left': TextNode.ALeft,
-        'right': TextNode.ARight,
-        'center': TextNode.ACenter,
-        TextNode.ALeft: TextNode.ALeft,
-        TextNode.ARight: TextNode.ARight,
-        TextNode.ACenter: TextNode.ACenter
-    }
+    Alignment = _ALIGN_STR_MAP
 
     def __init__(self, config_path: str, parent: object):
         InternalObject.__init__(self)
+        self.__font = None
+        self.__text = ''
+        self.__last_color = None
+        self.__text_geom = None
+        self.__geom_cache = collections.OrderedDict()
         self.__text_node = TextNode(self.__class__.__name__)
-        self.__nodepath = parent.attach_new_node(self.__text_node)
+        self.__nodepath = parent.attach_new_node(self.__class__.__name__)
         self.__nodepath.set_billboard_point_eye()
         self.__nodepath.set_light_off()
         self.__nodepath.set_color_off()
@@ -342,12 +416,19 @@ class TextBillboard(Configurable, InternalObject):
         else:
             self.__nodepath.hide()
 
-    def set_color(self, color: object) -> None:
+    def set_color(self, color: object, force: bool = False) -> None:
         """
-        Sets the object's text color
+        Sets the object's text color. Unchanged colors are ignored
+        unless forced
         """
 
+        color_key = tuple(color)
+        if not force and color_key == self.__last_color:
+            return
+
+        self.__last_color = color_key
         self.__text_node.set_text_color(color)
+        self.__invalidate_geom_cache()
 
     def get_color(self) -> object:
         """
@@ -362,6 +443,7 @@ class TextBillboard(Configurable, InternalObject):
         """
 
         self.__text_node.set_shadow_color(color)
+        self.__invalidate_geom_cache()
 
     def get_shadow_color(self) -> object:
         """
@@ -370,6 +452,35 @@ class TextBillboard(Configurable, InternalObject):
 
         return self.__text_node.get_shadow_color()
 
+    def set_text_size(self, size: float) -> None:
+        """
+        Sets the object's text size
+        """
+
+        self.__text_node.set_text_scale(size)
+        self.__invalidate_geom_cache()
+
+    def get_text_size(self) -> float:
+        """
+        Returns the object's text size
+        """
+
+        return self.__text_node.get_text_scale()
+
+    def set_position(self, position: object) -> None:
+        """
+        Sets the object's position relative to its parent
+        """
+
+        self.__nodepath.set_pos(position)
+
+    def get_position(self) -> object:
+        """
+        Returns the object's position relative to its parent
+        """
+
+        return self.__nodepath.get_pos()
+
     def set_font(self, font: object) -> None:
         """
         Sets the billboard's font object
@@ -378,24 +489,47 @@ class TextBillboard(Configurable, InternalObject):
         if not font:
             return
 
-        f = Font(font)
+        f = get_font(font)
+        self.__font = f
         tf = f.get_text_font()
         if tf:
             self.__text_node.set_font(tf)
+            self.__invalidate_geom_cache()
 
-    def set_text(self, text: str) -> None:
+    def set_text(self, text: str, force: bool = False) -> None:
         """
-        Sets the billboard's text value
+        Sets the billboard's text value. Unchanged text is ignored
+        unless forced
         """
 
-        self.__text_node.set_text(text)
+        if not force and text == self.__text and self.__text_geom is not None:
+            return
+
+        self.__text = text
+
+        key = (self.__font, text)
+        geom = self.__geom_cache.get(key)
+        if geom is None:
+            self.__text_node.set_text(text)
+            geom = NodePath(self.__text_node.generate())
+            self.__geom_cache[key] = geom
+            if len(self.__geom_cache) > _TEXT_GEOM_CACHE_SIZE:
+                self.__geom_cache.popitem(last=False)[1].remove_node()
+        else:
+            self.__geom_cache.move_to_end(key)
+
+        if self.__text_geom is not None:
+            self.__text_geom.detach_node()
+
+        geom.reparent_to(self.__nodepath)
+        self.__text_geom = geom
 
     def get_text(self) -> str:
         """
         Returns this billboard's text value
         """
 
-        return self.__text_node.get_text()
+        return self.__text
 
     def set_shadow_offset(self, offset: object) -> None:
         """
@@ -403,28 +537,47 @@ class TextBillboard(Configurable, InternalObject):
         """
 
         self.__text_node.set_shadow(offset)
+        self.__invalidate_geom_cache()
 
     def get_shadow_offset(self) -> object:
         """
         Returns the text shadow offset
         """
 
-        return self.__text_node.get_shadow(offset)
+        return self.__text_node.get_shadow()
 
     def set_align(self, align: object) -> None:
         """
         Sets the object's text alignment
         """
 
-        a = TextBillboard.Alignment.get(align.lower(), None)
-        if not a:
+        a = _resolve_alignment(align)
+        if a is None:
             self.notify.warning('Failed to align. Invalid alignment specified: %s' % str(align))
+            return
 
         self.__text_node.set_align(a)
+        self.__invalidate_geom_cache()
 
     def reparent_to(self, nodepath: object) -> None:
         """
         Reparents the object to the node path
         """
 
-        self.__nodepath.reparent_to(nodepath)
\ No newline at end of file
+        self.__nodepath.reparent_to(nodepath)
+
+    def __invalidate_geom_cache(self) -> None:
+        """
+        Clears the cached text geometry after a text property change and
+        regenerates the displayed text
+        """
+
+        if not self.__geom_cache:
+            return
+
+        for geom in self.__geom_cache.values():
+            geom.remove_node()
+
+        self.__geom_cache.clear()
+        self.__text_geom = None
+        self.set_text(self.__text, force=True)
@@ -24,17 +24,150 @@ SOFTWARE.
 
 import weakref
 import traceback
+import collections
+import functools
 
 from panda3d.core import PNMImage, Filename, TextureAttrib
 from panda3d.core import Texture
 
+from direct.task import Task
+
 from panda3d_gemstone.logging.utilities import get_notify_category
 from panda3d_gemstone.framework.internal_object import InternalObject
 from panda3d_gemstone.framework.utilities import get_camel_case
+from panda3d_gemstone.framework import exceptions
 from panda3d_gemstone.engine import runtime
 
 __texture_notify = get_notify_category('texture')
 
+_REQUEST_CPU = 1
+_REQUEST_GPU = 2
+
+_TEXTURE_ATTRIB_TYPE = TextureAttrib.get_class_type()
+_READ_ONLY_PREFIXES = ('get', 'has', 'is')
+
+_get_camel_case = functools.lru_cache(maxsize=256)(get_camel_case)
+
+def _make_pnm_method(name: str, mark_dirty: bool) -> object:
+    """
+    Returns a TextureBuffer method forwarding to the named PNMImage method.
+    Methods modifying the image flag the buffer as dirty
+    """
+
+    if not mark_dirty:
+        def method(self, *args, **kwargs):
+            return getattr(self._pnm, name)(*args, **kwargs)
+
+        return method
+
+    def method(self, *args, **kwargs):
+        results = getattr(self._pnm, name)(*args, **kwargs)
+        self.mark_dirty()
+
+        return results
+
+    return method
+
+__dirty_buffers = weakref.WeakSet()
+__commit_scheduled = False
+
+def _schedule_commit(buffer: object) -> None:
+    """
+    Queues a modified TextureBuffer for the next per frame commit. If no
+    task manager is available the buffer is committed immediately
+    """
+
+    global __commit_scheduled
+    if not runtime.has_task_mgr():
+        buffer.commit()
+        return
+
+    __dirty_buffers.add(buffer)
+    if not __commit_scheduled:
+        runtime.task_mgr.add(__commit_dirty_buffers, 'gs-commit-texture-buffers')
+        __commit_scheduled = True
+
+def __commit_dirty_buffers(task: object) -> int:
+    """
+    Commits all modified TextureBuffer objects
+    """
+
+    global __commit_scheduled
+    __commit_scheduled = False
+
+    buffers = list(__dirty_buffers)
+    __dirty_buffers.clear()
+    for buffer in buffers:
+        buffer.commit()
+
+    return Task.done
+
+def _import_numpy() -> object:
+    """
+    Imports the optional NumPy dependency used for bulk
+    texture data access
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        raise exceptions.MissingThirdpartySupportError('numpy')
+
+    return numpy
+
+__rescale_kernel = None
+
+def _rescale_u16_numpy(array: object, current_max: int, new_max: int) -> object:
+    """
+    Rescales a 2D array of pixel values from the current max value
+    to the new max value as uint16
+    """
+
+    np = _import_numpy()
+    scaled = (array.astype(np.uint32) * new_max + current_max // 2) // current_max
+    return scaled.astype(np.uint16)
+
+def _get_rescale_kernel() -> object:
+    """
+    Returns the heightfield rescale kernel. Returns the Numba compiled
+    kernel once warm_up_texture_kernels has compiled it. Otherwise the
+    vectorized NumPy variant, so a rescale never stalls on compilation
+    """
+
+    return __rescale_kernel or _rescale_u16_numpy
+
+def warm_up_texture_kernels() -> bool:
+    """
+    Compiles the Numba heightfield rescale kernel ahead of time using an
+    explicit signature. Intended to be called during application startup
+    or a loading screen. Returns true if the compiled kernel is in use
+    """
+
+    global __rescale_kernel
+    if __rescale_kernel is not None:
+        return True
+
+    try:
+        import numba
+    except ImportError:
+        return False
+
+    np = _import_numpy()
+
+    @numba.njit('uint16[:, ::1](uint16[:, ::1], int64, int64)', parallel=True, cache=True, fastmath=True)
+    def _rescale_u16(array, current_max, new_max):
+        rows, cols = array.shape
+        output = np.empty((rows, cols), dtype=np.uint16)
+        half_max = current_max // 2
+        for y in numba.prange(rows):
+            for x in range(cols):
+                output[y, x] = (np.uint32(array[y, x]) * new_max + half_max) // current_max
+
+        return output
+
+    __rescale_kernel = _rescale_u16
+    return True
+
 def load_texture(*args, **kwargs) -> object:
     """
     Loads a texture using the standard Panda3D Loader
@@ -84,17 +217,17 @@ def assign_texture_to_geom_node(geom_node: object, texture: object) -> None:
     assert geom_node != None
     assert hasattr(geom_node, 'get_num_geoms')
 
-    num_geoms = geom_node.get_num_geoms()
-    for index in range(num_geoms):
-        geom = geom_node.get_geom(index)
+    texture_attrib = TextureAttrib.make(texture)
+
+    # Geoms commonly share a state. Only build each new state once
+    states = {}
+    for index in range(geom_node.get_num_geoms()):
         geom_state = geom_node.get_geom_state(index)
-        
-        if geom_state.get_attrib(TextureAttrib.get_class_type()) != None:
-            new_state = geom_state.remove_attrib(TextureAttrib.get_class_type())
-        else:
-            new_state = geom_state
+        new_state = states.get(geom_state)
+        if new_state is None:
+            new_state = geom_state.remove_attrib(_TEXTURE_ATTRIB_TYPE).add_attrib(texture_attrib)
+            states[geom_state] = new_state
 
-        new_state = new_state.add_attrib(TextureAttrib.make(texture))
         geom_node.set_geom_state(index, new_state)
 
 def get_texture_from_geom_node(geom_node: object) -> object:
@@ -109,35 +242,36 @@ def get_texture_from_geom_node(geom_node: object) -> object:
         return None
 
     geom_state = geom_node.get_geom_state(0)
-    return geom_state.get_attrib(TextureAttrib.get_class_type()).get_texture()
+    return geom_state.get_attrib(_TEXTURE_ATTRIB_TYPE).get_texture()
 
 class TextureCache(InternalObject):
     """
     """
 
-    def __init__(self, load_async: bool = False):
+    __slots__ = ('max_size', 'texture_dict', 'image_dict', 'weakrefs', 'inflight',
+        '__load_image_func', '__load_texture_func')
+
+    def __init__(self, load_async: bool = False, max_size: int = 256):
         super().__init__()
 
-        self.texture_dict = {}
-        self.image_dict = {}
-        self.weakrefs = set()
-        self.requested_for_cpu = set()
-        self.requested_for_gpu = set()
-        self.requested_for_cpu_and_gpu = set()
+        self.max_size = max_size
+        self.texture_dict = collections.OrderedDict()
+        self.image_dict = collections.OrderedDict()
+        self.weakrefs = weakref.WeakSet()
+        self.inflight = {}
         self.set_load_async(load_async)
 
     def set_load_async(self, load_async: bool) -> None:
         """
+        Sets whether the cache loads its textures asynchronously
         """
 
         if load_async:
-            self.__load_texture_for_cpu_func = self.__load_texture_for_cpu
-            self.__load_texture_for_gpu_func = self.__load_texture_for_gpu
-            self.__load_texture_for_cpu_and_gpu_func = self.__load_texture_for_cpu_and_gpu
+            self.__load_image_func = self.__load_texture_for_cpu
+            self.__load_texture_func = self.__load_texture_for_gpu
         else:
-            self.__load_texture_for_cpu_func = self.__load_sync_Texture_for_cpu
-            self.__load_texture_for_gpu_func = self.__load_sync_texture_for_gpu
-            self.__load_texture_for_cpu_and_gpu_func = self.__load_sync_texture_for_cpu_and_gpu
+            self.__load_image_func = self.__load_sync_texture_for_cpu
+            self.__load_texture_func = self.__load_sync_texture_for_gpu
 
     def destroy(self) -> None:
         """
@@ -146,12 +280,10 @@ class TextureCache(InternalObject):
 
         InternalObject.destroy(self)
 
-        self.texture_dict = {}
-        self.image_dict = {}
-        self.weakrefs = set()
-        self.requested_for_cpu = set()
-        self.requested_for_gpu = set()
-        self.requested_for_cpu_and_gpu = set()
+        self.texture_dict = collections.OrderedDict()
+        self.image_dict = collections.OrderedDict()
+        self.weakrefs = weakref.WeakSet()
+        self.inflight = {}
 
     def has_texture(self, texture_name: str) -> bool:
         """
@@ -167,6 +299,43 @@ class TextureCache(InternalObject):
 
         return image_name in self.image_dict
 
+    def get_texture(self, texture_name: str) -> object:
+        """
+        Returns the cached texture if present. Otherwise NoneType
+        """
+
+        texture = self.texture_dict.get(texture_name)
+        if texture is not None:
+            self.texture_dict.move_to_end(texture_name)
+
+        return texture
+
+    def get_image(self, image_name: str) -> object:
+        """
+        Returns the cached image if present. Otherwise NoneType
+        """
+
+        image = self.image_dict.get(image_name)
+        if image is not None:
+            self.image_dict.move_to_end(image_name)
+
+        return image
+
+    def __cache_entry(self, cache: object, name: str, entry: object) -> None:
+        """
+        Stores the entry in the cache, evicting the least recently
+        used entries once the cache exceeds its max size
+        """
+
+        cache[name] = entry
+        cache.move_to_end(name)
+
+        while len(cache) > self.max_size:
+            evicted_name, evicted = cache.popitem(last=False)
+            self.notify.debug('Evicting texture: %s' % evicted_name)
+            if isinstance(evicted, Texture):
+                evicted.release_all()
+
     def __load_image(self, path: str, *args, **kwargs) -> object:
         """
         Loads an image using the Panda3D loader object
@@ -184,143 +353,137 @@ class TextureCache(InternalObject):
 
     def request_texture_cpu(self, texture_name: str, querying_obj: object) -> None:
         """
+        Requests the texture as a CPU side PNMImage
         """
 
-        exists = self.has_image(image_name)
-        self.__request_texture_generate(texture_name, querying_obj, exists, self.requested_for_cpu, self.__load_texture_for_cpu_func)
+        exists = self.has_image(texture_name)
+        self.__request_texture_generic(texture_name, querying_obj, exists, _REQUEST_CPU)
 
     def request_texture_gpu(self, texture_name: str, querying_obj: object) -> None:
         """
+        Requests the texture as a GPU side Texture
         """
 
-        exists = self.has_image(image_name)
-        self.__request_texture_generate(texture_name, querying_obj, exists, self.requested_for_gpu, self.__load_texture_for_gpu_func)
+        exists = self.has_texture(texture_name)
+        self.__request_texture_generic(texture_name, querying_obj, exists, _REQUEST_GPU)
 
     def request_texture_cpu_and_gpu(self, texture_name: str, querying_obj: object) -> None:
         """
+        Requests the texture as both a PNMImage and a Texture
         """
 
-        exists = self.has_image(image_name)
-        self.__request_texture_generate(texture_name, querying_obj, exists, self.requested_for_cpu_and_gpu, self.__load_texture_for_cpu_and_gpu_func)
+        exists = self.has_image(texture_name) and self.has_texture(texture_name)
+        self.__request_texture_generic(texture_name, querying_obj, exists, _REQUEST_CPU | _REQUEST_GPU)
 
-    def __request_texture_generic(self, texture_name: str, querying_obj: object, existing: bool, requested_set: object, load_function: object) -> None:
+    def __request_texture_generic(self, texture_name: str, querying_obj: object, existing: bool, flags: int) -> None:
         """
+        Performs a texture request. Requests for a path already in flight
+        are merged into the pending load instead of reading the file again
         """
 
         if existing:
             querying_obj.notify_of_new_texture()
+            return
+
+        self.__store_object(querying_obj)
+        if texture_name in self.inflight:
+            self.inflight[texture_name] |= flags
+            return
+
+        self.inflight[texture_name] = flags
+        if flags & _REQUEST_GPU:
+            self.__load_texture_func(texture_name)
         else:
-            self.__store_object(querying_obj)
-            if texture_name not in requested_set:
-                requested_set.update([texture_name])
-                load_function(texture_name)
+            self.__load_image_func(texture_name)
 
     def __load_texture_for_cpu(self, texture_name: str) -> None:
         """
+        Asynchronously reads the texture file into a PNMImage
         """
 
-        self.notify.debug('Requesting CPU only texture: %s' % texture_name)
+        self.notify.debug('Requesting CPU texture: %s' % texture_name)
         image = PNMImage()
-        runtime.loader.asyncPnmImageRead(image, Filename(texture_name), callback=self.__texture_loaded_for_cpu_only_async_callback, extraArgs=[texture_name, image])
+        runtime.loader.asyncPnmImageRead(image, Filename(texture_name), callback=self.__image_loaded_callback, extraArgs=[texture_name, image])
 
     def __load_texture_for_gpu(self, texture_name: str) -> None:
         """
+        Asynchronously loads the texture file into a Texture
         """
 
-        self.notify.debug('Requesting GPU only texture: %s' % texture_name)
-        self.__async_load_image(texture_name, callback=self.__texture_loaded_for_gpu_only_async_callback, extraArgs=[texture_name])
-
-    def __load_texture_for_cpu_and_gpu(self, texture_name: str) -> None:
-        """
-        """
-
-        self.notify.debug('Requesting CPU and GPU texture: %s' % texture_name)
-        self.__async_load_image(texture_name, callback=self.__texture_loaded_for_cpu_and_gpu_async_callback, extraArgs=[texture_name])
+        self.notify.debug('Requesting GPU texture: %s' % texture_name)
+        self.__async_load_image(texture_name, callback=self.__texture_loaded_callback, extraArgs=[texture_name])
 
     def __load_sync_texture_for_cpu(self, texture_name: str) -> None:
         """
+        Reads the texture file into a PNMImage
         """
 
-        self.notify.debug('Requesting CPU only texture: %s' % texture_name)
+        self.notify.debug('Requesting CPU texture: %s' % texture_name)
         image = PNMImage()
         success = PNMImage.read(image, Filename(texture_name))
-        self.__texture_loaded_for_cpu_only_async_callback(success, texture_name, image)
+        self.__image_loaded_callback(success, texture_name, image)
 
     def __load_sync_texture_for_gpu(self, texture_name: str) -> None:
         """
+        Loads the texture file into a Texture
         """
 
-        self.notify.debug('Requesting GPU only texture: %s' % texture_name)
-        texture = self.__load_image(texture_name)
-        self.__texture_loaded_for_gpu_only_async_callback(texture, texture_name)
-
-    def __load_sync_texture_for_cpu_and_gpu(self, texture_name: str) -> None:
-        """
-        """
-
-        self.notify.debug('Requesting CPU and GPU texture: %s' % texture_name)
+        self.notify.debug('Requesting GPU texture: %s' % texture_name)
         texture = self.__load_image(texture_name)
-        self.__texture_loaded_for_cpu_and_gpu_async_callback(texture, texture_name)
+        self.__texture_loaded_callback(texture, texture_name)
 
     def __store_object(self, obj: object) -> None:
         """
         Stores the weakref reference to the object for later use
         """
 
-        self.weakrefs.update([weakref.ref(obj)])
+        self.weakrefs.add(obj)
 
     def __notify_all_objects(self) -> None:
         """
+        Notifies all waiting objects of a newly loaded texture. Objects
+        returning true are no longer waiting and are removed
         """
 
-        list_of_refs_to_remove = []
-        for obj in self.weakrefs:
-            reference = obj()
-            if reference is None:
-                list_of_refs_to_remove.remove(obj)
-            else:
-                if reference.notify_of_new_texture():
-                    list_of_refs_to_remove.append(obj)
-        
-        for obj in list_of_refs_to_remove:
-            self.weakrefs.remove(obj)
+        for obj in list(self.weakrefs):
+            if obj.notify_of_new_texture():
+                self.weakrefs.discard(obj)
 
-    def __texture_loaded_for_cpu_only_async_callback(self, success: bool, texture_name: str, texture: object) -> None:
+    def __image_loaded_callback(self, success: bool, texture_name: str, image: object) -> None:
         """
+        Called when a PNMImage load completes. Also builds the Texture
+        if a GPU request was merged in while the read was in flight
         """
 
         self.notify.debug('Received CPU texture: %s' % texture_name)
-        self.request_texture_cpu.remove(texture_name)
-        self.image_dict[texture_name] = texture
+        flags = self.inflight.pop(texture_name, _REQUEST_CPU)
+        self.__cache_entry(self.image_dict, texture_name, image)
 
         if not success:
-            self.notify.warning('Async texture load for CPU failed (%s)' % texture_name)
+            self.notify.warning('Texture load for CPU failed (%s)' % texture_name)
+        elif flags & _REQUEST_GPU:
+            texture = Texture(texture_name)
+            texture.load(image)
+            self.__cache_entry(self.texture_dict, texture_name, texture)
         
         self.__notify_all_objects()
 
-    def __texture_loaded_for_gpu_only_async_callback(self, texture: object, texture_name: object) -> None:
+    def __texture_loaded_callback(self, texture: object, texture_name: object) -> None:
         """
+        Called when a Texture load completes. Also stores a PNMImage copy
+        if a CPU request is pending for the same path
         """
 
         self.notify.debug('Received GPU texture: %s' % texture_name)
-        self.requested_for_gpu.remove(texture_name)
-        self.texture_dict[texture_name] = texture
-
-        if not texture:
-            self.notify.warning('Async texture load for GPU failed (%s)' % texture_name)
-
-        self.__notify_all_objects()
-
-    def __texture_loaded_for_cpu_and_gpu_async_callback(self, texture: object, texture_name: object) -> None:
-        """
-        """
-
-        self.notify.debug('Received CPU and GPU texture: %s' % texture_name)
-        self.requested_for_cpu_and_gpu.remove(texture_name)
-        self.texture_dict[texture_name] = texture_name
+        flags = self.inflight.pop(texture_name, _REQUEST_GPU)
+        self.__cache_entry(self.texture_dict, texture_name, texture)
 
         if not texture:
-            self.notify.warning('Async texture load for CPU and GPU failed (%s)' % texture_name)
+            self.notify.warning('Texture load for GPU failed (%s)' % texture_name)
+        elif flags & _REQUEST_CPU:
+            image = PNMImage()
+            texture.store(image)
+            self.__cache_entry(self.image_dict, texture_name, image)
 
         self.__notify_all_objects()
 
@@ -332,8 +495,37 @@ class TextureBuffer(Texture, InternalObject):
     def __init__(self, *args, **kwargs):
         Texture.__init__(self)
         InternalObject.__init__(self)
-        self._pnm = PNMImage(*args, **kwargs)
-        self.refresh()
+        self.__pnm = None
+        self._dirty = False
+
+        # Read image files straight into the texture. The PNMImage
+        # copy is only created once it is first accessed
+        if len(args) == 1 and not kwargs and isinstance(args[0], Filename):
+            if not self.read(args[0]):
+                self.notify.warning('Failed to read texture buffer image: %s' % args[0])
+        else:
+            self.__pnm = PNMImage(*args, **kwargs)
+            self.refresh()
+
+    @property
+    def _pnm(self) -> PNMImage:
+        """
+        Returns the buffer's PNMImage, storing the texture contents into a
+        new image on first access
+        """
+
+        if self.__pnm is None:
+            self.__pnm = PNMImage()
+            self.store(self.__pnm)
+
+        return self.__pnm
+
+    def has_pnm_image(self) -> bool:
+        """
+        Returns true if the buffer's PNMImage has been created
+        """
+
+        return self.__pnm is not None
 
     @classmethod
     def load_file(cls: object, file_path: str) -> object:
@@ -344,20 +536,24 @@ class TextureBuffer(Texture, InternalObject):
         instance = cls(Filename(file_path))
         return instance
 
-    def __wrapper(self, method, *args, **kwargs) -> object:
+    def mark_dirty(self) -> None:
         """
-        Wrapper for a PNMImage function to auto update our 
-        texture instance
+        Flags the internal PNMImage as modified. The texture is updated
+        on the next commit, which runs automatically once per frame
         """
 
-        results = None
-        try:
-            result = method(*args, **kwargs)
-        except Exception as e:
-            raise e
+        if not self._dirty:
+            self._dirty = True
+            _schedule_commit(self)
 
-        self.refresh()
-        return results
+    def commit(self) -> None:
+        """
+        Uploads the internal PNMImage into the texture if it has been
+        modified since the last commit
+        """
+
+        if self._dirty:
+            self.refresh()
 
     def refresh(self) -> None:
         """
@@ -367,28 +563,31 @@ class TextureBuffer(Texture, InternalObject):
 
         self.notify.debug('Refreshing %s %d' % (
             self.__class__.__name__, id(self)))
+        self._dirty = False
         self.load(self._pnm)
 
     def __getattr__(self, key: str) -> object:
         """
-        Custom attribute getter for wrapping the Panda3D PNMImage object
+        Custom attribute getter for wrapping the Panda3D PNMImage object.
+        Resolved methods are stored on the class so later lookups
+        bypass this handler
         """
 
-        results = None
-        is_getter = key.startswith('get')
-        if hasattr(self._pnm, key):
-            results = getattr(self._pnm, key)
-            if is_getter:
-                results = lambda *args, **kwargs: self.__wrapper(results, *args, **kwargs)
-        elif hasattr(self._pnm, get_camel_case(key)):
-            results = getattr(self._pnm, get_camel_case(key))
-            if is_getter:
-                results = lambda *args, **kwargs: self.__wrapper(results, *args, **kwargs)
+        pnm = self._pnm
+        name = key
+        results = getattr(pnm, name, None)
+        if results is None:
+            name = _get_camel_case(key)
+            results = getattr(pnm, name, None)
 
-        if not results:
+        if results is None:
             raise AttributeError('%s does not have attribute %s' % (
                 self.__class__.__name__, key))
 
+        if callable(results):
+            setattr(self.__class__, key, _make_pnm_method(name, not key.startswith(_READ_ONLY_PREFIXES)))
+            return getattr(self, key)
+
         return results
 
 class HeightfieldBuffer(TextureBuffer):
@@ -401,10 +600,84 @@ class HeightfieldBuffer(TextureBuffer):
         super().__init__(*args, **kwargs)
         self.__set_max_value()
 
+    def __get_array_dtype(self) -> object:
+        """
+        Returns the NumPy dtype matching the texture's component type.
+        Raises a ValueError for component types without a matching dtype
+        """
+
+        np = _import_numpy()
+        component_type = self.get_component_type()
+        if component_type == Texture.T_unsigned_byte:
+            return np.uint8
+        elif component_type == Texture.T_unsigned_short:
+            return np.uint16
+        elif component_type == Texture.T_float:
+            return np.float32
+
+        raise ValueError('Unsupported heightfield component type: %s' % component_type)
+
+    def as_array(self) -> object:
+        """
+        Returns the heightfield's texture data as a NumPy array of shape
+        (y_size, x_size) for single channel images, otherwise
+        (y_size, x_size, num_components). Rows are ordered bottom to top
+        as stored by Panda3D. Bulk transforms should operate on this array
+        and be written back with commit_array rather than using per pixel
+        PNMImage calls
+        """
+
+        np = _import_numpy()
+        dtype = self.__get_array_dtype()
+        data = np.frombuffer(memoryview(self.get_ram_image()), dtype=dtype)
+
+        num_components = self.get_num_components()
+        shape = (self.get_y_size(), self.get_x_size())
+        if num_components > 1:
+            shape = shape + (num_components,)
+
+        return data.reshape(shape)
+
+    def commit_array(self, array: object) -> None:
+        """
+        Uploads a array returned by as_array back into the texture without
+        a PNMImage round trip. The internal PNMImage is not updated
+        """
+
+        np = _import_numpy()
+        dtype = self.__get_array_dtype()
+        self.set_ram_image(np.ascontiguousarray(array, dtype=dtype).tobytes())
+
     def __set_max_value(self) -> None:
         """
         Sets the required max value of a gpu heightfield
         """
         
-        self.set_maxval(65535)
+        if self.get_component_type() == Texture.T_float:
+            return
+
+        if self.has_pnm_image():
+            current_max = self._pnm.get_maxval()
+            self._pnm.set_maxval(65535)
+        else:
+            current_max = 65535 if self.get_component_width() == 2 else 255
+
+        if current_max == 65535:
+            return
+
+        # Rescale the texture data directly when NumPy is available
+        # instead of reloading it from the PNMImage
+        try:
+            np = _import_numpy()
+        except exceptions.MissingThirdpartySupportError:
+            self._pnm.set_maxval(65535)
+            self.refresh()
+            return
+
+        array = self.as_array()
+        rows = np.ascontiguousarray(array.reshape(array.shape[0], -1), dtype=np.uint16)
+        scaled = _get_rescale_kernel()(rows, current_max, 65535)
+
+        self.set_component_type(Texture.T_unsigned_short)
+        self.set_ram_image(scaled.tobytes())
         
\ No newline at end of file
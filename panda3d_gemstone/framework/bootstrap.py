@@ -24,6 +24,7 @@ SOFTWARE.
 
 from panda3d_gemstone.logging import utilities as __logging
 import importlib as __importlib
+import sys as __sys
 
 __bootstrap_notify = __logging.get_notify_category('bootstrap')
 
@@ -77,15 +78,26 @@ def batch_instantiate_singletons(singleton_list: list) -> None:
     Batch instantiates singletons from a list
     """
 
+    modules = {}
+    classes = {}
     for singleton in singleton_list:
         module_name, class_name, args = singleton
-        module_path = '%s.%s' % (module_name, class_name)
-        singleton_module = __import_module(module_path)
-        if singleton_module is None:
-            __bootstrap_notify.warning('Failed to setup singleton: %s. Invalid import' % class_name)
-            continue
+        class_key = (module_name, class_name)
+        singleton_cls = classes.get(class_key)
+        if singleton_cls is None:
+
+            # Reuse modules already imported by earlier entries
+            singleton_module = modules.get(module_name) or __sys.modules.get(module_name)
+            if singleton_module is None:
+                singleton_module = __import_module('%s.%s' % (module_name, class_name))
+            if singleton_module is None:
+                __bootstrap_notify.warning('Failed to setup singleton: %s. Invalid import' % class_name)
+                continue
+
+            modules[module_name] = singleton_module
+            singleton_cls = getattr(singleton_module, class_name)
+            classes[class_key] = singleton_cls
 
-        singleton_cls = getattr(singleton_module, class_name)
         singleton_cls.instantiate_singleton(*args)
 
 def __verify_thirdparty(modules: object) -> None:
@@ -102,7 +114,12 @@ def bootstrap_module(class_list: list = [], meta_list: list = [], singleton_list
     Performs initial boostrap operations on a module
     """
 
-    class_registry = get_class_registry()
-    batch_instantiate_singletons(singleton_list)
-    class_registry.batch_register_classes(class_list, meta_list)
-    __verify_thirdparty(thirdparty)
+    if singleton_list:
+        batch_instantiate_singletons(singleton_list)
+
+    if class_list or meta_list:
+        class_registry = get_class_registry()
+        class_registry.batch_register_classes(class_list, meta_list)
+
+    if thirdparty:
+        __verify_thirdparty(thirdparty)
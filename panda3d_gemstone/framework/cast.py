@@ -22,11 +22,14 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import copy
 import logging
-from functools import reduce
+import re
+from functools import lru_cache
 
 from panda3d.core import BitMask32, Point2, Point3
 from panda3d.core import Point4, Vec2, Vec3, Vec4
+from panda3d.core import ConfigVariableBool
 
 from panda3d_gemstone.framework.registry import ClassRegistry
 
@@ -51,6 +54,14 @@ class Caster(object):
 
         raise NotImplementedError('%s called! Custom call function not implemented!' % self.__class__.__name__)
 
+    def get_prefixes(self) -> tuple:
+        """
+        Returns the leading characters accepted values can start with.
+        Casters returning NoneType are checked against every value
+        """
+
+        return None
+
 def get_class_registry() -> ClassRegistry:
     """
     Returns the class registry singleton object
@@ -58,22 +69,76 @@ def get_class_registry() -> ClassRegistry:
 
     return ClassRegistry.instantiate_singleton()
 
+_CASTER_CLASSES = []
+_external_casters = False
+
 def register_caster(*args, **kwargs) -> None:
     """
     Registrs a class with the class registry
     """
 
+    global _external_casters
+    _external_casters = True
+
     registry = get_class_registry()
     registry.register_class(is_caster=True, *args, **kwargs)
 
-def __register_internal_caster(class_name) -> None:
+def __register_internal_caster(caster_cls: type) -> None:
     """
     Registers an internal caster class with the class registry
     based inside this module
     """
 
+    _CASTER_CLASSES.append(caster_cls)
+
+    class_name = caster_cls.__name__
     package_path = 'panda3d_gemstone.framework.cast.%s' % class_name
-    register_caster(class_name, package_path)
+    get_class_registry().register_class(class_name, package_path, is_caster=True)
+
+_IMMUTABLE_TYPES = (int, float, bool, str, type(None))
+_VALUE_TYPES = (BitMask32, Point2, Point3, Point4, Vec2, Vec3, Vec4)
+_VECTORIZED_SPLIT_LENGTH = 64
+_MISSING = object()
+_INT_RE = re.compile(r'^\s*[+-]?\d+\s*$')
+_NUMERIC_PREFIX_RE = re.compile(r'^\s*[+-]?(\d|\.\d|inf|nan)', re.IGNORECASE)
+
+def _compile_call_pattern(type_name: str) -> object:
+    """
+    Returns the compiled pattern matching a type_name(...) value and
+    capturing its arguments
+    """
+
+    return re.compile(r'^%s\((.*)\)$' % re.escape(type_name), re.DOTALL)
+
+@lru_cache(maxsize=None)
+def _get_numpy() -> object:
+    """
+    Returns the optional NumPy module if available. Otherwise NoneType
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+def _copy_cast_result(output: object) -> object:
+    """
+    Returns a copy of a cached cast result so callers are free
+    to mutate the values they receive
+    """
+
+    if isinstance(output, _IMMUTABLE_TYPES):
+        return output
+    elif isinstance(output, list):
+        return [_copy_cast_result(v) for v in output]
+    elif isinstance(output, tuple):
+        return tuple(_copy_cast_result(v) for v in output)
+    elif isinstance(output, _VALUE_TYPES):
+        return output.__class__(output)
+
+    return copy.copy(output)
 
 class CastBridge(object):
     """
@@ -81,7 +146,11 @@ class CastBridge(object):
     known casters within the gemstone framework
     """
 
-    __casters__ = []
+    __casters__ = None
+    __dispatch__ = {}
+    __fallback__ = ()
+    __keywords__ = {}
+    __quoted__ = False
     __primitives__ = [int, float]
 
     @classmethod
@@ -107,17 +176,52 @@ class CastBridge(object):
         instantion
         """
 
+        # Config literals repeat constantly. Reuse the cached result
+        if isinstance(value, str):
+            return _copy_cast_result(_cast_str(value))
+
+        return cls._cast(value)
+
+    @classmethod
+    def _cast(cls, value: object) -> object:
+        """
+        Performs the cast operation against the primitives and
+        registered casters
+        """
+
         output = value
 
+        # Classify strings before attempting the primitive casts so
+        # non numeric values skip raising and catching exceptions
+        primitives = cls.__primitives__
+        if isinstance(value, str) and primitives == [int, float]:
+            if _INT_RE.match(value):
+                return int(value)
+            elif not _NUMERIC_PREFIX_RE.match(value):
+                primitives = ()
+
         # Attempt to cast against primtives
-        for primitive in cls.__primitives__:
+        for primitive in primitives:
             success, output = cls.__attempt_primitive_cast(primitive, value)
             if success:
                 return output
 
-        # Attempt to cast against casters
+        # Setup the casters on first use if not setup on import
+        if cls.__casters__ is None:
+            _setup_casting()
+
+        # Resolve keyword and quoted string casts without the caster calls
         output = str(value).strip()
-        for cast in cls.__casters__:
+        keyword = cls.__keywords__.get(output.lower(), _MISSING)
+        if keyword is not _MISSING:
+            return keyword
+
+        if cls.__quoted__ and output[:1] in ('"', "'") and output[:1] == output[-1:]:
+            return output[1:-1]
+
+        # Attempt to cast against the casters accepting the leading character
+        casters = cls.__dispatch__.get(output[:1], cls.__fallback__)
+        for cast in casters:
             if cast.accepted(output):
                 output = cast(output)
                 break
@@ -126,6 +230,14 @@ class CastBridge(object):
 
 cast = CastBridge
 
+@lru_cache(maxsize=4096)
+def _cast_str(value: str) -> object:
+    """
+    Returns the cached cast result of a string value
+    """
+
+    return CastBridge._cast(value)
+
 class SequenceCaster(Caster):
     """
     """
@@ -142,10 +254,23 @@ class SequenceCaster(Caster):
 
         return value and value[0] == self._left and value[-1] == self._right
 
+    def get_prefixes(self) -> tuple:
+        """
+        Returns the leading characters accepted values can start with
+        """
+
+        return (self._left,)
+
     def __split(self, value: str) -> list:
         """
         """
 
+        if len(value) >= _VECTORIZED_SPLIT_LENGTH and value.isascii():
+            np = _get_numpy()
+            words = self.__split_vectorized(np, value) if np is not None else None
+            if words is not None:
+                return words
+
         words = []
         word = ''
         stack = []
@@ -168,6 +293,34 @@ class SequenceCaster(Caster):
         
         return words
 
+    def __split_vectorized(self, np: object, value: str) -> list:
+        """
+        Splits the ascii value on top level seperators using the
+        bracket depth prefix sum instead of walking each character.
+        Returns NoneType for unbalanced closing brackets so the
+        character walk can report them
+        """
+
+        buf = np.frombuffer(value.encode('ascii'), dtype=np.uint8)
+        delta = (buf == ord(self._left)).astype(np.int32) - (buf == ord(self._right)).astype(np.int32)
+        depth = np.cumsum(delta)
+        if depth.min() < 0:
+            return None
+
+        splits = np.flatnonzero((buf == ord(self._seperator)) & (depth == 0)).tolist()
+
+        words = []
+        start = 0
+        for split in splits:
+            words.append(value[start:split].strip())
+            start = split + 1
+
+        word = value[start:].strip()
+        if word:
+            words.append(word)
+
+        return words
+
     def __call__(self, value):
         """
         """
@@ -199,6 +352,13 @@ class StringCaster(Caster):
 
         return value.lower() == self._key
 
+    def get_prefixes(self) -> tuple:
+        """
+        Returns the leading characters accepted values can start with
+        """
+
+        return (self._key[:1].lower(), self._key[:1].upper())
+
     def __call__(self, value) -> object:
         """
         Returns the requested cast value provided
@@ -213,7 +373,7 @@ class ScalarCaster(Caster):
 
     def __init__(self, type_name: str, classes: []):
         self._type_name = type_name
-        self._type_name_len = len(type_name)
+        self._pattern = _compile_call_pattern(type_name)
         self._classes = classes
 
     def accepted(self, value: str) -> bool:
@@ -221,17 +381,22 @@ class ScalarCaster(Caster):
         Returns true if the string value matches the scalar cast inputs
         """
 
-        return value[:self._type_name_len] == self._type_name and value[self._type_name_len] == '(' and value[-1] == ')'
+        return self._pattern.match(value) is not None
+
+    def get_prefixes(self) -> tuple:
+        """
+        Returns the leading characters accepted values can start with
+        """
+
+        return (self._type_name[0],)
 
     def __call__(self, value: str) -> object:
         """
         """
 
-        value = value[self._type_name_len + 1:-1]
-        value = value.split(',')
+        value = self._pattern.match(value).group(1).split(',')
         cls = self._classes[len(value) - 2]
-        value = [float(n) for n in value]
-        return cls(*value)
+        return cls(*map(float, value))
 
 class FalseCast(StringCaster):
     """
@@ -240,7 +405,7 @@ class FalseCast(StringCaster):
     def __init__(self):
         super().__init__('false', False)
 
-__register_internal_caster('FalseCast')
+__register_internal_caster(FalseCast)
 
 class TrueCast(StringCaster):
     """
@@ -249,7 +414,7 @@ class TrueCast(StringCaster):
     def __init__(self):
         super().__init__('true', True)
 
-__register_internal_caster('TrueCast')
+__register_internal_caster(TrueCast)
 
 class ListCast(SequenceCaster):
     """
@@ -258,7 +423,7 @@ class ListCast(SequenceCaster):
     def __init__(self):
         super().__init__(list, '[', ']', ',')
 
-__register_internal_caster('ListCast')
+__register_internal_caster(ListCast)
 
 class NoneCast(StringCaster):
     """
@@ -267,7 +432,7 @@ class NoneCast(StringCaster):
     def __init__(self):
         super().__init__('none', None)
 
-__register_internal_caster('NoneCast')
+__register_internal_caster(NoneCast)
 
 class PandaBitCast(Caster):
     """
@@ -275,33 +440,34 @@ class PandaBitCast(Caster):
 
     def __init__(self):
         self._type_name = 'Bit'
-        self._type_name_len = len(self._type_name)
+        self._pattern = _compile_call_pattern(self._type_name)
 
     def accepted(self, value: str) -> bool:
         """
         """
 
-        return value[:self._type_name_len] == self._type_name and value[self._type_name_len] == '(' and value[-1] == ')'
+        return self._pattern.match(value) is not None
+
+    def get_prefixes(self) -> tuple:
+        """
+        """
+
+        return (self._type_name[0],)
 
     def __call__(self, value) -> object:
         """
         """
 
-        value = value[self._type_name_len + 1:-1]
-        value = value.split(',')
-        bits = []
+        value = self._pattern.match(value).group(1).split(',')
+        mask = 0
 
         for n in value:
             if n:
-                n = int(n)
-                bits.append(BitMask32.bit(n))
+                mask |= 1 << int(n)
 
-        if bits:
-            return reduce(BitMask32.__or__, bits)
-        else:
-            return BitMask32()
+        return BitMask32(mask)
 
-__register_internal_caster('PandaBitCast')
+__register_internal_caster(PandaBitCast)
 
 class PandaPointCast(ScalarCaster):
     """
@@ -310,7 +476,7 @@ class PandaPointCast(ScalarCaster):
     def __init__(self):
         super().__init__('Point', (Point2, Point3, Point4))
 
-__register_internal_caster('PandaPointCast')
+__register_internal_caster(PandaPointCast)
 
 class PandaVectorCast(ScalarCaster):
     """
@@ -319,7 +485,7 @@ class PandaVectorCast(ScalarCaster):
     def __init__(self):
         super().__init__('Vec', (Vec2, Vec3, Vec4))
 
-__register_internal_caster('PandaVectorCast')
+__register_internal_caster(PandaVectorCast)
 
 class QuotedStringCast(Caster):
     """
@@ -331,13 +497,19 @@ class QuotedStringCast(Caster):
 
         return value and value[0] == value[-1] and value[0] in ('"', "'")
 
+    def get_prefixes(self) -> tuple:
+        """
+        """
+
+        return ('"', "'")
+
     def __call__(self, value: str) -> object:
         """
         """
 
         return value[1:-1]
 
-__register_internal_caster('QuotedStringCast')
+__register_internal_caster(QuotedStringCast)
 
 class TupleCast(SequenceCaster):
     """
@@ -346,15 +518,56 @@ class TupleCast(SequenceCaster):
     def __init__(self):
         super().__init__(tuple, '(', ')', ',')
 
-__register_internal_caster('TupleCast')
+__register_internal_caster(TupleCast)
 
-def __setup_casting() -> None:
+def _setup_casting() -> None:
     """
     Performs casting setup operations
     """
 
-    # Setup bridge casters from registry
-    CastBridge.__casters__ = [cls() for cls in get_class_registry().query_meta(is_caster=True)]
-
-# Perform setup on import
-__setup_casting()
\ No newline at end of file
+    # Setup bridge casters. The registry is only queried when casters
+    # have been registered from outside this module
+    if _external_casters:
+        caster_classes = get_class_registry().query_meta(is_caster=True)
+    else:
+        caster_classes = _CASTER_CLASSES
+
+    casters = tuple(cls() for cls in caster_classes)
+    CastBridge.__casters__ = casters
+
+    # Build the leading character dispatch table. Each entry keeps
+    # the registration order of the casters so the first accepted cast wins
+    prefixes = {}
+    fallback = []
+    for caster in casters:
+        caster_prefixes = caster.get_prefixes()
+        if caster_prefixes is None:
+            fallback.append(caster)
+        else:
+            for prefix in caster_prefixes:
+                prefixes.setdefault(prefix, set()).add(caster)
+
+    CastBridge.__dispatch__ = {
+        prefix: tuple(caster for caster in casters if caster in accepted or caster in fallback)
+        for prefix, accepted in prefixes.items()
+    }
+    CastBridge.__fallback__ = tuple(fallback)
+
+    # Build the keyword lookup from the string casters. Keywords are only
+    # added when the string caster is the first caster accepting them
+    keywords = {}
+    for caster in casters:
+        if isinstance(caster, StringCaster):
+            candidates = CastBridge.__dispatch__.get(caster._key[:1], CastBridge.__fallback__)
+            if next((c for c in candidates if c.accepted(caster._key)), None) is caster:
+                keywords.setdefault(caster._key, caster._obj)
+
+    CastBridge.__keywords__ = keywords
+    CastBridge.__quoted__ = all(
+        CastBridge.__dispatch__.get(quote, (None,))[0].__class__ is QuotedStringCast
+        for quote in ('"', "'"))
+    _cast_str.cache_clear()
+
+# Perform setup on import unless deferred until the first cast
+if ConfigVariableBool('gs-eager-casters', True).value:
+    _setup_casting()
\ No newline at end of file
@@ -24,10 +24,14 @@ SOFTWARE.
 
 import os
 import sys
-import copy
 import configparser
+import copy
+import functools
+import marshal
 import pickle
 
+from concurrent.futures import ThreadPoolExecutor
+
 from panda3d_gemstone.logging.utilities import get_notify_category
 from panda3d_gemstone.engine import runtime, prc
 
@@ -36,16 +40,84 @@ from panda3d_gemstone.io.file_system import get_file_date
 from panda3d_gemstone.framework.cast import cast
 from panda3d_gemstone.framework.utilities import get_snake_case
 
-from panda3d.core import ConfigVariableBool, VirtualFileSystem
+from panda3d.core import ConfigVariableBool, ConfigVariableInt, VirtualFileSystem
 from panda3d.core import Filename
 
 _config_notify = get_notify_category('configurable')
+_get_snake_case = functools.lru_cache(maxsize=512)(get_snake_case)
+_setter_cache = {}
+_loader_cache = {}
 
 class BaseConfigurableCache(InternalObject):
     """
     Base class for all configurable cache handlers
     """
 
+    # Configuration values are never interpolated. Caches requiring
+    # interpolation can override this with configparser.ConfigParser
+    _parser_cls = configparser.RawConfigParser
+
+    def prefetch(self, paths: list, cls: object) -> None:
+        """
+        Reads the requested files into the cache in parallel. Each unique
+        path is read by a single worker so every cache entry has one writer
+        """
+
+        paths = list(dict.fromkeys(paths))
+        if not paths:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            futures = [(path, executor.submit(self.read, path, cls)) for path in paths]
+
+        for path, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                self.notify.warning('Failed to prefetch config "%s": %s' % (path, str(e)))
+
+    def _read_file(self, filepath: str) -> tuple:
+        """
+        Reads the ini file using a single open handle. Returns the reader
+        and the file's modification date. Otherwise NoneType and zero
+        """
+
+        reader = self._parser_cls()
+        reader.optionxform = str
+        self.notify.info('Reading config: %s' % filepath)
+
+        try:
+            with open(filepath, 'r', encoding='utf-8') as fh:
+                date = os.fstat(fh.fileno()).st_mtime
+                reader.read_file(fh, filepath)
+        except FileNotFoundError:
+            self.notify.warning('Failed to load ini file "%s". Path does not exist' % (filepath))
+            return (None, 0)
+        except Exception as e:
+            self.notify.error('Failed to read ini file "%s": %s' % (filepath, str(e)))
+            return (None, 0)
+
+        return (reader, date)
+
+    @staticmethod
+    def _serialize(reader: configparser.RawConfigParser) -> bytes:
+        """
+        Serializes the reader's sections into the binary dat format
+        """
+
+        return marshal.dumps({section: reader.items(section) for section in reader.sections()})
+
+    def _deserialize(self, data: bytes) -> configparser.RawConfigParser:
+        """
+        Rebuilds a reader from the binary dat format
+        """
+
+        reader = self._parser_cls()
+        reader.optionxform = str
+        reader.read_dict({section: dict(items) for section, items in marshal.loads(data).items()})
+
+        return reader
+
 class VFSConfigurableCache(BaseConfigurableCache):
     """
     Caching object for the configuration files
@@ -69,8 +141,12 @@ class VFSConfigurableCache(BaseConfigurableCache):
             filepath_dat_name = Filename(filepath_dat)
             fh = self.vfs.get_file(filepath_dat_name)
             if fh:
-                reader = pickle.loads(fh.read_file(True))
+                reader = self._deserialize(fh.read_file(True))
                 self.__files[filepath] = reader
+            else:
+                reader = self.__read_legacy_dat(filepath)
+                if reader is not None:
+                    self.__files[filepath] = reader
             fh = None
 
         if filepath not in self.__files:
@@ -79,6 +155,20 @@ class VFSConfigurableCache(BaseConfigurableCache):
 
         return self.__files[filepath]
 
+    def __read_legacy_dat(self, filepath: str) -> object:
+        """
+        Reads a pickled dat file written before the binary dat2 format.
+        Returns NoneType if no legacy dat file exists
+        """
+
+        filepath_dat = os.path.splitext(filepath)[0] + '.dat'
+        fh = self.vfs.get_file(Filename(filepath_dat))
+        if not fh:
+            return None
+
+        self.notify.warning('Reading legacy dat file: %s. Regenerate it with OSConfigurableCache.write_cache_files' % filepath_dat)
+        return pickle.loads(fh.read_file(True))
+
     def get_notify_name(self) -> str:
         """
         Returns this object's custom notifier name
@@ -97,24 +187,6 @@ class RawOSConfigurableCache(BaseConfigurableCache):
         super().__init__()
         self._files = {}
 
-    def __read_file(self, filepath: str, clsName: str) -> configparser.ConfigParser:
-        """
-        """
-
-        reader = configparser.ConfigParser()
-        reader.optionxform = str
-        self.notify.info('Reading config: %s' % filepath)
-
-        try:
-            if not reader.read(filepath):
-                self.notify.warning('Failed to load ini file "%s". Path does not exist' % (filepath))
-                return None
-        except Exception as e:
-            self.notify.error('Failed to read ini file "%s": %s' % (filepath, str(e)))
-            return None
-
-        return reader
-
     def read(self, filepath: str, cls) -> object:
         """
         Reads the requested file from the cache
@@ -122,8 +194,7 @@ class RawOSConfigurableCache(BaseConfigurableCache):
 
         # Add the file to the cache if not already added
         if filepath not in self._files:
-            reader = self.__read_file(filepath, cls.__name__)
-            self._files[filepath] = (reader, get_file_date(filepath))
+            self._files[filepath] = self._read_file(filepath)
 
         return self._files[filepath][0]
 
@@ -144,6 +215,8 @@ class OSConfigurableCache(BaseConfigurableCache):
         super().__init__()
         self._files = {}
         self._use_dat = ConfigVariableBool('gs-use-dat', False).value
+        self._frozen = ConfigVariableBool('gs-config-frozen', False).value
+        self._dat_threshold = ConfigVariableInt('gs-dat-threshold', 4096).value
 
     @staticmethod
     def get_cache_filename(filepath: str) -> str:
@@ -152,62 +225,83 @@ class OSConfigurableCache(BaseConfigurableCache):
         """
 
         output, ext = os.path.splitext(filepath)
-        output += '.dat'
+        output += '.dat2'
 
         return output
 
-    def __read_file(self, filepath: str, clsName: str) -> configparser.ConfigParser:
+    def write_cache_file(self, filepath: str) -> object:
         """
+        Reads the ini file and writes its binary dat file next to it.
+        Returns the reader or NoneType if the file could not be read
         """
 
-        reader = configparser.ConfigParser()
-        reader.optionxform = str
-        self.notify.info('Reading config: %s' % filepath)
-
-        try:
-            if not reader.read(filepath):
-                self.notify.warning('Failed to load ini file "%s". Path does not exist' % (filepath))
-                return None
-        except Exception as e:
-            self.notify.error('Failed to read ini file "%s": %s' % (filepath, str(e)))
-            return None
+        reader, _ = self._read_file(filepath)
+        if reader:
+            with open(OSConfigurableCache.get_cache_filename(filepath), 'wb') as fh:
+                fh.write(self._serialize(reader))
 
         return reader
 
+    def write_cache_files(self, paths: list) -> int:
+        """
+        Writes the binary dat files for the requested ini files. Intended
+        as a build step before packing files for the VFSConfigurableCache.
+        Returns the number of dat files written
+        """
+
+        return sum(1 for path in paths if self.write_cache_file(path) is not None)
+
     def read(self, filepath: str, cls) -> object:
         """
         Reads the requested file from the cache
         """
 
+        # Frozen caches never check for changes after the first read
+        if self._frozen and filepath in self._files:
+            return self._files[filepath][0]
+
         dat_file = OSConfigurableCache.get_cache_filename(filepath)
-        if get_file_date(filepath) > get_file_date(dat_file):
+        dat_date = get_file_date(dat_file)
+        reader = None
+        file_date = get_file_date(filepath)
+        if file_date > dat_date:
+
+            # Small files parse faster than writing and reading a dat
+            # file. Read them directly without a dat file
+            if os.path.getsize(filepath) < self._dat_threshold:
+                cached = self._files.get(filepath)
+                if cached is None or file_date > cached[1]:
+                    self.notify.debug('Skipping dat file for small config: %s' % filepath)
+                    self._files[filepath] = self._read_file(filepath)
+
+                return self._files[filepath][0]
 
             # Create a new dat file if it does not exist
             try:
-                reader = self.__read_file(filepath, cls.__name__)
+                reader = self.write_cache_file(filepath)
                 if reader:
-                    fh = open(dat_file, 'wb')
-                    fh.write(pickle.dumps(
-                        reader,
-                        protocol=pickle.HIGHEST_PROTOCOL))
-                    fh.close()
+                    dat_date = get_file_date(dat_file)
             except IOError:
                 pass
 
         # Add the file to the cache if not already added
         if filepath not in self._files:
-            if get_file_date(dat_file) and self._use_dat:
+            if reader is None:
+                if dat_date and self._use_dat:
+                    fh = open(dat_file, 'rb')
+                    reader = self._deserialize(fh.read())
+                    fh.close()
+                else:
+                    reader, _ = self._read_file(filepath)
+
+            self._files[filepath] = (reader, dat_date)
+        elif dat_date > self._files[filepath][1]:
+            if reader is None:
                 fh = open(dat_file, 'rb')
-                reader = pickle.load(fh.read())
+                reader = self._deserialize(fh.read())
                 fh.close()
 
-                self._files[filepath] = (reader, get_file_date(dat_file))
-            else:
-                reader = self.__read_file(filepath, cls.__name__)
-                self._files[filepath] = (reader, get_file_date(dat_file))
-        elif get_file_date(dat_file) > self._files[filepath][1]:
-            reader = pickle.load(open(dat_file, 'rb'))
-            self._files[filepath] = (reader, get_file_date(dat_file))
+            self._files[filepath] = (reader, dat_date)
 
         if filepath not in self._files:
             self.notify.warning('Failed to read file: %s. Not found' % filepath)
@@ -253,7 +347,7 @@ class Configurable(object):
         Returns this configurables working config value
         """
 
-        self.__config
+        return self.__config
 
     def __prepare_data(self, data: dict) -> dict:
         """
@@ -261,11 +355,15 @@ class Configurable(object):
         by casting it to its respective type
         """
 
-        new_data = {}
-        for key, value in data:
-            new_data[key] = cast(value)
+        return {sys.intern(key): cast(value) for key, value in data}
 
-        return new_data
+    @staticmethod
+    def prefetch(paths: list, cls: object = None) -> None:
+        """
+        Warms the configuration cache with the requested file paths
+        """
+
+        Configurable.__cache.prefetch(paths, cls or Configurable)
 
     def __fixup_include_config_path(self, config_path: str) -> str:
         """
@@ -300,22 +398,34 @@ class Configurable(object):
         main_section = osection or self.section
 
         if self.__config.has_section(main_section):
-            data = self.__config.items(main_section)
+            # Separate the include path from the section data
+            include_path = None
+            pending = []
+            for key, value in self.__config.items(main_section):
+                if key == Configurable.__include_str:
+                    include_path = value
+                else:
+                    pending.append((key, value))
 
             # Process include path if present
-            include_path = dict(data).get(Configurable.__include_str)
             if include_path:
                 included_configurable = Configurable(
                     path=self.__fixup_include_config_path(include_path),
                     fixup_include_path_func=self._fixup_include_path_func)
                 self._included_config = included_configurable.config
-                self.configuration = copy.copy(included_configurable.configuration)
+
+                # The included configurable is discarded after this point. Take
+                # ownership of its configuration instead of copying it
+                self.configuration = included_configurable.configuration
                 processed_section.append(main_section)
 
+                # The included sections are merged into the configuration
+                # below. Merge into a copy so the cached reader is unchanged
+                self.__config = copy.deepcopy(self.__config)
+
             # Populate section data in configuration dict
-            for key, value in data:
-                if key != Configurable.__include_str:
-                    self.configuration[key] = cast(value) 
+            for key, value in pending:
+                self.configuration[sys.intern(key)] = cast(value)
 
         # Load all sections in our configuration object
         for section in self.__config.sections():
@@ -362,8 +472,8 @@ class Configurable(object):
         requested config section
         """
         
-        snake_case = get_snake_case(section)
-        return 'load_%s_data' % snake_case
+        snake_case = _get_snake_case(section)
+        return sys.intern('load_%s_data' % snake_case)
 
     def __load_section(self, section: str, data: object) -> None:
         """
@@ -371,25 +481,37 @@ class Configurable(object):
         configurable object
         """
 
-        # Retrieve the loader function if present
-        loader_name = self.__get_loader_name(section)
+        # Retrieve the loader function if present. Loader names are
+        # resolved once per configurable class
+        loader_names = _loader_cache.get(self.__class__)
+        if loader_names is None:
+            loader_names = _loader_cache[self.__class__] = {}
+
+        if section in loader_names:
+            loader_name = loader_names[section]
+        else:
+            loader_name = self.__get_loader_name(section)
+            if not hasattr(self, loader_name):
+                loader_name = None
+
+            loader_names[section] = loader_name
 
         # Process the section's data
-        if hasattr(self, loader_name):
+        if loader_name is not None:
             loader = getattr(self, loader_name)
             loader(self.__prepare_data(data))
         else:
             if self.__want_config_warnings:
                 _config_notify.warning('Failed to load section for %s. Section loader "%s" does not exist' % (
                     self.__class__.__name__, section))
-            self.load_data(section, self.__prepare_data)
+            self.load_data(section, self.__prepare_data(data))
 
     def __get_snake_case(self, label: str) -> str:
         """
         Returns the label as a snake case variant
         """
 
-        return get_snake_case(label)
+        return _get_snake_case(label)
 
     def __get_setter_name(self, key: str) -> str:
         """
@@ -397,7 +519,7 @@ class Configurable(object):
         from its configuration key
         """
 
-        setter_name = 'set_%s' % (self.__get_snake_case(key))
+        setter_name = sys.intern('set_%s' % (self.__get_snake_case(key)))
         return setter_name
 
     def initialize(self) -> None:
@@ -412,8 +534,18 @@ class Configurable(object):
             
             return
 
+        # Setter names are resolved once per configurable class. Setters
+        # are still looked up on the instance to support setters provided
+        # through __getattr__
+        setter_names = _setter_cache.get(self.__class__)
+        if setter_names is None:
+            setter_names = _setter_cache[self.__class__] = {}
+
         for key, value in list(self.configuration.items()):
-            setter_name = self.__get_setter_name(key)
+            setter_name = setter_names.get(key)
+            if setter_name is None:
+                setter_name = setter_names[key] = self.__get_setter_name(key)
+
             setter = getattr(self, setter_name, None)
 
             if setter:
@@ -25,30 +25,163 @@ SOFTWARE.
 from panda3d_gemstone.framework.registry import ClassRegistryMixIn
 from panda3d_gemstone.framework.configurable import Configurable
 from panda3d_gemstone.framework.internal_object import InternalObject
+from panda3d_gemstone.framework.runnable import Runnable
+from panda3d_gemstone.framework.singleton import Singleton
 from panda3d_gemstone.framework import utilities
 from panda3d_gemstone.framework.service import Service, Command
 
 from panda3d_gemstone.logging.utilities import get_notify_category
 
-from panda3d.core import NodePath
+from panda3d.core import NodePath, AsyncFuture
 
-__controller_notify = get_notify_category('controller')
+import collections
+import re
+
+_controller_notify = get_notify_category('controller')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_MOVED = 1
+_TURNED = 2
+
+_scratch_pool = []
+
+def _acquire_scratch() -> NodePath:
+    """
+    Borrows a scratch nodepath from the shared pool used by controllers
+    to hold transient transforms during an update
+    """
+
+    if _scratch_pool:
+        return _scratch_pool.pop()
+
+    return NodePath('controller-scratch')
+
+def _release_scratch(scratch: NodePath) -> None:
+    """
+    Returns a scratch nodepath to the shared pool
+    """
+
+    scratch.clear_transform()
+    _scratch_pool.append(scratch)
+
+def _transform_changed(px: float, py: float, pz: float, qr: float, qi: float, qj: float, qk: float,
+                       px2: float, py2: float, pz2: float, qr2: float, qi2: float, qj2: float, qk2: float,
+                       eps: float = 1e-6) -> int:
+    """
+    Compares two positions and rotations component wise and returns the
+    moved and turned flags. Rotations are compared by the absolute dot
+    product so that q and -q are treated as the same orientation
+    """
+
+    flags = 0
+    if abs(px - px2) > eps or abs(py - py2) > eps or abs(pz - pz2) > eps:
+        flags |= _MOVED
+
+    dot = qr * qr2 + qi * qi2 + qj * qj2 + qk * qk2
+    if abs(dot) < 1.0 - eps:
+        flags |= _TURNED
+
+    return flags
 
 class Controller(Configurable, InternalObject):
     """
     Base class for all controllers in the Geomstone framework
     """
 
+    is_async = False
+    flat_update = True
+
+    __next_controller = None
+    _prev_controller = None
+    _chain_cache = None
+    _method_cache = None
+    _flat_chain = None
+    _flags = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Controllers overriding the node update operations with coroutines
+        # require the async update path. Otherwise the synchronous path is used
+        if 'is_async' not in cls.__dict__:
+            cls.is_async = any(
+                getattr(cls, name) is not getattr(Controller, name) and utilities.is_awaitable_function(getattr(cls, name))
+                for name in ('update', 'update_node', 'forward_node'))
+
+        # Controllers overriding the chain traversal itself must be updated recursively
+        if 'flat_update' not in cls.__dict__:
+            cls.flat_update = cls.update is Controller.update and cls.update_sync is Controller.update_sync
+
     def __init__(self, config_path: str, next_controller: object = None, section = None):
         Configurable.__init__(self, config_path, section or self.__class__.__name__)
         InternalObject.__init__(self)
 
         self.next_controller = next_controller
-        self.moved = False
-        self.turned = False
-        self.update_nodepath = NodePath('')
+        self._flags = 0
         self.initialize()
 
+    @property
+    def next_controller(self) -> object:
+        """
+        Next controller in the controller chain
+        """
+
+        return self.__next_controller
+
+    @next_controller.setter
+    def next_controller(self, next_controller: object) -> None:
+        """
+        Sets the next controller and invalidates the cached
+        controller chains containing this controller
+        """
+
+        previous = self.__next_controller
+        if previous is not None and previous._prev_controller is self:
+            previous._prev_controller = None
+
+        self.__next_controller = next_controller
+        if next_controller is not None:
+            next_controller._prev_controller = self
+
+        controller = self
+        while controller is not None:
+            controller._chain_cache = None
+            controller._method_cache = None
+            controller._flat_chain = None
+            controller = controller._prev_controller
+
+    @property
+    def moved(self) -> bool:
+        """
+        Value is true if the controller moved during its last update
+        """
+
+        return bool(self._flags & _MOVED)
+
+    @moved.setter
+    def moved(self, moved: bool) -> None:
+        """
+        Sets the moved state of the controller
+        """
+
+        self._flags = (self._flags & ~_MOVED) | (_MOVED if moved else 0)
+
+    @property
+    def turned(self) -> bool:
+        """
+        Value is true if the controller turned during its last update
+        """
+
+        return bool(self._flags & _TURNED)
+
+    @turned.setter
+    def turned(self, turned: bool) -> None:
+        """
+        Sets the turned state of the controller
+        """
+
+        self._flags = (self._flags & ~_TURNED) | (_TURNED if turned else 0)
+
     @property
     def changed(self) -> bool:
         """
@@ -63,8 +196,6 @@ class Controller(Configurable, InternalObject):
         """
 
         self.next_controller = None
-        self.update_nodepath.remove_node()
-        self.update_nodepath = None
 
     def set_next_controller(self, next_controller: object) -> None:
         """
@@ -97,87 +228,268 @@ class Controller(Configurable, InternalObject):
         Returns true if the controller has changed
         """
 
-        return self.moved or self.turned
+        return self._flags != 0
 
-    def walk_controller_chain(self, ignore_self: bool = False) -> None:
+    def any_changed(self) -> bool:
         """
+        Returns true if any controller in the chain has changed. Stops at the
+        first changed controller instead of collecting every flag like
+        foreach_get('changed') would
         """
 
-        if ignore_self:
-            controller = self.get_next_controller()
-        else:
+        return any(controller._flags for controller in self.get_controller_chain())
+
+    def get_controller_chain(self) -> tuple:
+        """
+        Returns the controller chain starting at this controller. The chain
+        is cached until a next controller in the chain changes
+        """
+
+        chain = self._chain_cache
+        if chain is None:
+            chain = []
             controller = self
+            while controller:
+                chain.append(controller)
+                controller = controller.next_controller
+
+            chain = self._chain_cache = tuple(chain)
 
-        while controller:
-            yield controller
-            controller = controller.get_next_controller()
+        return chain
+
+    def walk_controller_chain(self, ignore_self: bool = False) -> object:
+        """
+        """
+
+        chain = self.get_controller_chain()
+        return iter(chain[1:] if ignore_self else chain)
 
     def foreach_get(self, attr: object) -> list:
         """
         """
 
-        values = []
-        for controller in self.walk_controller_chain():
-            values.append(getattr(controller, attr, None))
+        return [getattr(controller, attr, None) for controller in self.get_controller_chain()]
 
-        return values
+    def __get_chain_methods(self, method: str, ignore_self: bool) -> tuple:
+        """
+        Returns the bound methods of the controllers in the chain implementing
+        the requested method. Cached until the controller chain changes
+        """
+
+        cache = self._method_cache
+        if cache is None:
+            cache = self._method_cache = {}
+
+        key = (method, ignore_self)
+        functions = cache.get(key)
+        if functions is None:
+            functions = (getattr(controller, method, None) for controller in self.walk_controller_chain(ignore_self))
+            functions = cache[key] = tuple(function for function in functions if function)
+
+        return functions
 
     def foreach_call(self, method: object, *args, **kwargs) -> list:
         """
         """
 
-        return utilities.foreach_call_method_by_name(self.walk_controller_chain(False), method, *args, **kwargs)
+        functions = self.__get_chain_methods(method, False)
+        if args or kwargs:
+            return [function(*args, **kwargs) for function in functions]
+
+        return [function() for function in functions]
 
     def _foreach_call_others(self, method: object, *args, **kwargs) -> list:
         """
         """
 
-        return utilities.foreach_call_method_by_name(self.walk_controller_chain(True), method, *args, **kwargs)
+        functions = self.__get_chain_methods(method, True)
+        if args or kwargs:
+            return [function(*args, **kwargs) for function in functions]
 
-    async def update_node(self, nodepath: object, dt: float) -> object:
+        return [function() for function in functions]
+
+    def is_async_chain(self) -> bool:
+        """
+        Returns true if any controller in the chain requires the async update path
+        """
+
+        for controller in self.get_controller_chain():
+            if controller.is_async:
+                return True
+
+        return False
+
+    def update_node_sync(self, nodepath: object, dt: float) -> object:
         """
+        Synchronous variant of update_node for controllers without
+        async update operations
         """
 
         return nodepath
 
+    async def update_node(self, nodepath: object, dt: float) -> object:
+        """
+        """
+
+        return self.update_node_sync(nodepath, dt)
+
     async def forward_node(self, nodepath: object, dt: float) -> object:
         """
         """
 
-        return await self.next_controller.update(nodepath, dt)
+        return await self.next_controller._update_async(nodepath, dt)
 
     async def update(self, nodepath: object, dt: float) -> object:
         """
+        Updates the chain on a pooled scratch nodepath holding a copy of the
+        nodepath's transform. Returns the resulting TransformState
         """
 
-        prev_direction = nodepath.get_quat()
-        prev_position = nodepath.get_pos()
+        if not self.is_async_chain():
+            return self.update_sync(nodepath, dt)
 
-        new_nodepath = self.update_nodepath
-        new_nodepath.set_mat(nodepath.get_mat())
-        new_nodepath = await self.update_node(new_nodepath, dt)
+        scratch = _acquire_scratch()
+        try:
+            scratch.set_transform(nodepath.get_transform())
+            result = await self._update_async(scratch, dt)
+            return result.get_transform()
+        finally:
+            _release_scratch(scratch)
+
+    def __update_changed(self, prev_transform: object, transform: object) -> None:
+        """
+        Updates the moved and turned states from the transform before
+        and after the update
+        """
+
+        # Unchanged transforms skip extracting the position and rotation
+        if transform.compare_to(prev_transform) == 0:
+            self._flags = 0
+            return
+
+        pos = transform.get_pos()
+        quat = transform.get_quat()
+        prev_pos = prev_transform.get_pos()
+        prev_quat = prev_transform.get_quat()
+        self._flags = _transform_changed(
+            pos[0], pos[1], pos[2], quat[0], quat[1], quat[2], quat[3],
+            prev_pos[0], prev_pos[1], prev_pos[2], prev_quat[0], prev_quat[1], prev_quat[2], prev_quat[3])
+
+    def is_flat_chain(self) -> bool:
+        """
+        Returns true if the chain can be updated with a flat traversal
+        """
+
+        flat = self._flat_chain
+        if flat is None:
+            flat = self._flat_chain = all(controller.flat_update for controller in self.get_controller_chain())
+
+        return flat
+
+    def __update_flat(self, nodepath: object, dt: float) -> object:
+        """
+        Updates the chain by iterating the flattened controller tuple
+        instead of recursing through each next controller
+        """
+
+        chain = self.get_controller_chain()
+        functions = self.__get_chain_methods('update_node_sync', False)
+
+        prev_transforms = []
+        for controller, function in zip(chain, functions):
+            prev_transform = nodepath.get_transform()
+            prev_transforms.append(prev_transform)
+            nodepath = function(nodepath, dt)
+
+        transform = nodepath.get_transform()
+        for controller, prev_transform in zip(chain, prev_transforms):
+            controller.__update_changed(prev_transform, transform)
+
+        return nodepath
+
+    def update_sync(self, nodepath: object, dt: float) -> object:
+        """
+        Performs the update operation without entering the async machinery.
+        Only valid when no controller in the chain is async. Returns the
+        resulting TransformState
+        """
+
+        scratch = _acquire_scratch()
+        try:
+            scratch.set_transform(nodepath.get_transform())
+            return self._update_chain_sync(scratch, dt).get_transform()
+        finally:
+            _release_scratch(scratch)
+
+    def _update_chain_sync(self, nodepath: object, dt: float) -> object:
+        """
+        Updates the chain in place on the scratch nodepath
+        """
+
+        if self.is_flat_chain():
+            return self.__update_flat(nodepath, dt)
+
+        prev_transform = nodepath.get_transform()
+        new_nodepath = self.update_node_sync(nodepath, dt)
 
         if self.next_controller:
-            new_nodepath = await self.forward_node(new_nodepath, dt)
+            new_nodepath = self.next_controller._update_chain_sync(new_nodepath, dt)
+
+        self.__update_changed(prev_transform, new_nodepath.get_transform())
+
+        return new_nodepath
+
+    async def _update_async(self, nodepath: object, dt: float) -> object:
+        """
+        """
+
+        prev_transform = nodepath.get_transform()
+        new_nodepath = await self.update_node(nodepath, dt)
 
-        direction = new_nodepath.get_quat()
-        position = new_nodepath.get_pos()
+        if self.next_controller:
+            new_nodepath = await self.forward_node(new_nodepath, dt)
 
-        self.moved = not position.almost_equal(prev_position)
-        self.turned = not direction.almost_equal(prev_direction)
+        self.__update_changed(prev_transform, new_nodepath.get_transform())
 
         return new_nodepath
 
+def _find_by_name(chain: tuple, name: str) -> list:
+    """
+    Returns the controllers in the chain configured from the section name
+    """
+
+    return [controller for controller in chain if controller.section == name]
+
+def _find_by_cls(chain: tuple, cls: type) -> list:
+    """
+    Returns the controllers in the chain that are instances of the class
+    """
+
+    return [controller for controller in chain if isinstance(controller, cls)]
+
 class ControllerChainMixIn(ClassRegistryMixIn):
     """
     """
 
+    _controller_cls_cache = {}
+
+    @classmethod
+    def clear_controller_cache(cls) -> None:
+        """
+        Clears the resolved controller classes. Required after
+        reloading the class registry
+        """
+
+        ControllerChainMixIn._controller_cls_cache.clear()
+
     def call_controller_chain(self, controller_chain: object, function_name: object, *args, **kwargs) -> object:
         """
+        Calls the function on every controller in the chain if a chain is
+        present. Per frame call sites should call foreach_call on the chain
+        directly to avoid the extra frame
         """
 
-        if controller_chain:
-            return controller_chain.foreach_call(function_name, *argsm **kwargs)
+        return controller_chain and controller_chain.foreach_call(function_name, *args, **kwargs)
 
     def setup_controller_chain(self, controller_chain_str: str, config_path: str) -> object:
         """
@@ -186,34 +498,45 @@ class ControllerChainMixIn(ClassRegistryMixIn):
         first_controller = None
 
         if controller_chain_str:
-            controller_chain = [ c.strip() for c in controller_chain_str.split(' ') ]
-            controller_chain.reverse()
-            for controller_name in controller_chain:
-                cls = self._get_class(controller_name + 'Controller')
-                setup = self._get_class_meta(controller_name + 'Controller', 'Controller.setup')
+            controller_chain = [c for c in _WHITESPACE_RE.split(controller_chain_str.strip()) if c]
+            cls_cache = ControllerChainMixIn._controller_cls_cache
+            for controller_name in reversed(controller_chain):
+                entry = cls_cache.get(controller_name)
+                if entry is None:
+                    class_name = controller_name + 'Controller'
+                    entry = (self._get_class(class_name), self._get_class_meta(class_name, 'Controller.setup'))
+
+                    # Only cache resolved classes so late registrations are still found
+                    if entry[0]:
+                        cls_cache[controller_name] = entry
+
+                cls, setup = entry
                 if cls:
                     first_controller = cls(config_path, next_controller=first_controller)
                     if setup:
                         setup(first_controller, self)
                 else:
-                    __controller_notify.error("Failed to setup controller '%s' (%s). Class not found" % (controller_name, self.__class__.__name__))
+                    _controller_notify.error("Failed to setup controller '%s' (%s). Class not found" % (controller_name, self.__class__.__name__))
                     return
 
+            # Flatten the chain once up front so the first update does not pay for it
+            if first_controller is not None:
+                first_controller.get_controller_chain()
+
         return first_controller
 
     def find_controller(self, controller_chain: object, cls_or_name: object, as_list: bool = False) -> object:
         """
         """
 
-        controller = []
-        while controller_chain:
-            if isinstance(cls_or_name, str):
-                if controller_chain.section == cls_or_name:
-                    controller.append(controller_chain)
-            elif isinstance(controller_chain, cls_or_name):
-                if isinstance(controller_chain, cls_or_name):
-                    controller.append(controller_chain)
-            controller_chain = controller_chain.get_next_controller()
+        if not controller_chain:
+            return [] if as_list else None
+
+        chain = controller_chain.get_controller_chain()
+        if isinstance(cls_or_name, str):
+            controller = _find_by_name(chain, cls_or_name)
+        else:
+            controller = _find_by_cls(chain, cls_or_name)
 
         if as_list or len(controller) > 1:
             return controller
@@ -231,3 +554,140 @@ class ControllerService(Controller, Service):
     def __init__(self, *args, **kwargs):
         Service.__init__(self)
         Controller.__init__(self, *args, **kwargs)
+
+class _Suspend(object):
+    """
+    Awaitable passing a suspension value up to the task running
+    the controller scheduler
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: object):
+        self.value = value
+
+    def __await__(self):
+        return (yield self.value)
+
+class _UpdateFailure(object):
+    """
+    Result delivered to a scheduler submitter when the controller update
+    raised. Panda3D futures cannot carry exceptions, so the submitter
+    re-raises the stored exception
+    """
+
+    __slots__ = ('error',)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+class ControllerScheduler(Singleton, Runnable, InternalObject):
+    """
+    Batches async controller chain updates submitted during a frame. The
+    batched coroutines are resumed round robin and the futures they suspend
+    on are awaited together, instead of each entity awaiting its chain
+    independently
+    """
+
+    def __init__(self, batch_size: int = 64, priority: int = 50):
+        InternalObject.__init__(self)
+        Runnable.__init__(self, priority)
+        self.__batch_size = batch_size
+        self.__queue = collections.deque()
+        Singleton.__init__(self)
+        self.activate()
+
+    def destroy(self) -> None:
+        """
+        Called on the destruction of the scheduler
+        """
+
+        self.deactivate()
+        for controller, nodepath, dt, future in self.__queue:
+            future.cancel()
+
+        self.__queue.clear()
+
+    async def submit(self, controller: object, nodepath: object, dt: float) -> object:
+        """
+        Submits the controller update to the next batch and returns
+        the resulting TransformState once the batch has run
+        """
+
+        # Synchronous chains never suspend and are updated immediately
+        if not controller.is_async_chain():
+            return controller.update_sync(nodepath, dt)
+
+        future = AsyncFuture()
+        self.__queue.append((controller, nodepath, dt, future))
+
+        result = await future
+        if result.__class__ is _UpdateFailure:
+            raise result.error
+
+        return result
+
+    async def tick(self, dt: float) -> None:
+        """
+        Runs the submitted controller updates once per frame
+        """
+
+        await self.run_batch()
+
+    async def run_batch(self) -> None:
+        """
+        Runs all queued controller updates in batches of the configured size
+        """
+
+        queue = self.__queue
+        while queue:
+            batch = []
+            for i in range(min(self.__batch_size, len(queue))):
+                controller, nodepath, dt, future = queue.popleft()
+                batch.append((controller.update(nodepath, dt), future))
+
+            await self.__run_coroutines(batch)
+
+    async def __run_coroutines(self, batch: list) -> None:
+        """
+        Resumes each coroutine until it suspends. Coroutines yielding to the
+        next frame share a single yield, and the futures the others suspend
+        on are awaited together before the next round resumes them
+        """
+
+        pending = [(coroutine, future, None) for coroutine, future in batch]
+        while pending:
+            suspended = []
+            for coroutine, future, awaited in pending:
+                if awaited is not None and not awaited.done():
+                    suspended.append((coroutine, future, awaited))
+                    continue
+
+                try:
+                    awaited = coroutine.send(None)
+                except StopIteration as e:
+                    future.set_result(e.value)
+                except Exception as e:
+                    future.set_result(_UpdateFailure(e))
+                else:
+                    suspended.append((coroutine, future, awaited))
+
+            pending = suspended
+            waiting = [awaited for coroutine, future, awaited in suspended if awaited is not None and not awaited.done()]
+            if any(awaited is None for coroutine, future, awaited in suspended):
+                await _Suspend(None)
+            elif waiting and len(waiting) == len(suspended):
+                await _Suspend(waiting[0] if len(waiting) == 1 else AsyncFuture.gather(*waiting))
+
+async def update_controller_chain(controller: object, nodepath: object, dt: float) -> object:
+    """
+    Updates the controller chain and returns the resulting TransformState.
+    Updates are batched through the controller scheduler when one has
+    been instantiated
+    """
+
+    scheduler = ControllerScheduler.get_singleton(silent=True)
+    if scheduler is None:
+        return await controller.update(nodepath, dt)
+
+    return await scheduler.submit(controller, nodepath, dt)
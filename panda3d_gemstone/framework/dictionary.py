@@ -24,28 +24,30 @@ SOFTWARE.
 
 from panda3d_gemstone.logging.utilities import get_notify_category
 
-__notify = get_notify_category('dictionary')
+_notify = get_notify_category('dictionary')
 
 class ObjectDictionary(dict):
     """
     """
 
     def __init__(self):
-        super.__init__()
+        super().__init__()
 
     def add_object(self, obj: object) -> None:
         """
         """
 
-        if not hasattr(obj, 'get_object_id'):
-            self.notify.warning('Attempted to add an invalid object to %s (%s)' % (
+        get_object_id = getattr(obj.__class__, 'get_object_id', None)
+        if get_object_id is None:
+            _notify.warning('Attempted to add an invalid object to %s (%s)' % (
                 self.__class__.__name__, obj.__class__.__name__))
             
             return
 
-        object_id = obj.get_object_id()
-        if object_id in self:
-            self.notify.warning('Attempted to add duplicate object to %s.' % self.__class__.__name__)
+        object_id = get_object_id(obj)
+        previous = self.get(object_id)
+        if previous is not None and previous is not obj:
+            _notify.warning('Attempted to add duplicate object to %s.' % self.__class__.__name__)
         self[object_id] = obj
 
     def lookup_object(self, object_id: int) -> object:
@@ -54,6 +56,6 @@ class ObjectDictionary(dict):
 
         obj = self.get(object_id, None)
         if obj is None:
-            __notify.warning('Object lookup failed. %s is not a known object idetifier' % object_id)
+            _notify.warning('Object lookup failed. %s is not a known object idetifier' % object_id)
     
         return obj
@@ -29,15 +29,12 @@ def verify_thirdparty_modules(modules: object) -> None:
     a MissingThirdpartySupportError is thrown
     """
 
-    if isinstance(modules, list):
-        module_list = modules
-    else:
-        module_list = [modules]
+    module_list = [modules] if isinstance(modules, str) else modules
 
     from panda3d_gemstone.engine import runtime
+    has_thirdparty = runtime.has_thirdparty
     for module in module_list:
-        found = runtime.has_thirdparty(module)
-        if not found:
+        if not has_thirdparty(module):
             raise MissingThirdpartySupportError(module)
 
 def verify_attribute(obj: object, attrib_name: str) -> None:
@@ -27,20 +27,85 @@ from direct.showbase.DirectObject import DirectObject
 from panda3d_gemstone.logging import utilities as logging
 from panda3d_gemstone.framework.utilities import get_snake_case
 
+_notify_name_cache = {}
+_notify_cache = {}
+
+def _get_class_notify(obj: object) -> object:
+    """
+    Returns the notifier for the object's class. Notifier names
+    are constant per class so the notifier is created once per class
+    """
+
+    cls = obj.__class__
+    notify = _notify_cache.get(cls)
+    if notify is None:
+        notify = _notify_cache[cls] = logging.get_notify_category(obj.get_notify_name())
+
+    return notify
+
+def _get_class_notify_name(cls: type) -> str:
+    """
+    Returns the default notifier name for the class
+    """
+
+    name = _notify_name_cache.get(cls)
+    if name is None:
+        name = _notify_name_cache[cls] = get_snake_case(cls.__name__, splitter='-')
+
+    return name
+
+class _ClassNotify(object):
+    """
+    Resolves the notifier on first access and stores it on the instance's
+    class, so later accesses are a plain class attribute read
+    """
+
+    __slots__ = ()
+
+    def __get__(self, obj: object, cls: type) -> object:
+        if obj is None:
+            return self
+
+        notify = _get_class_notify(obj)
+        setattr(obj.__class__, 'notify', notify)
+
+        return notify
+
 class InternalObject(object):
     """
     Base class for all Gemstone framework internal objects
     """
 
+    __slots__ = ()
+
+    notify = _ClassNotify()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Each class resolves its own notifier rather than inheriting
+        # one already resolved by its parent class. Notifiers defined
+        # explicitly by a parent class are inherited as is
+        if 'notify' in cls.__dict__:
+            return
+
+        for base in cls.__mro__[1:]:
+            if 'notify' in base.__dict__:
+                inherited = base.__dict__['notify']
+                if isinstance(inherited, _ClassNotify) or inherited is _notify_cache.get(base):
+                    cls.notify = InternalObject.__dict__['notify']
+
+                break
+
     def __init__(self, *args, **kwargs):
-        self.notify = logging.get_notify_category(self.get_notify_name())
+        pass
 
     def get_notify_name(self) -> str:
         """
         Returns this object's notifier name
         """
 
-        return get_snake_case(self.__class__.__name__, splitter='-')
+        return _get_class_notify_name(self.__class__)
 
     def destroy(self) -> None:
         """
@@ -63,24 +128,16 @@ class PandaBaseObject(DirectObject):
 
     def __init__(self, *args, **kwargs):
         DirectObject.__init__(self, *args, **kwargs)
-        self.__notify = logging.get_notify_category(self.get_notify_name())
+        self.notify = _get_class_notify(self)
         self.notify.warning('%s is inheriting from legacy object: PandaBaseObject' % (
             self.__class__.__name__))
 
-    @property
-    def notify(self) -> object:
-        """
-        Returns this object's notifier logger
-        """
-
-        return self.__notify
-
     def get_notify_name(self) -> str:
         """
         Returns this object's notifier name
         """
 
-        return get_snake_case(self.__class__.__name__, splitter='-')
+        return _get_class_notify_name(self.__class__)
 
     def destroy(self) -> None:
         """
@@ -25,6 +25,7 @@ SOFTWARE.
 import os
 import sys
 import copy
+import weakref
 
 from panda3d_gemstone.framework.internal_object import InternalObject
 from panda3d_gemstone.framework.configurable import Configurable, RawOSConfigurableCache
@@ -38,6 +39,53 @@ from panda3d_gemstone.engine.audio import SoundManager
 
 from panda3d.core import ConfigVariableList
 
+def _format_sequence_setting(value: object) -> str:
+    """
+    Formats a sequence engine setting as space separated words
+    """
+
+    return ' '.join(map(str, value))
+
+_MISSING = object()
+
+_IMMUTABLE_SETTING_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+def _copy_setting_value(value: object) -> object:
+    """
+    Copies a settings value. Immutable values are shared and containers
+    are copied directly, falling back to deepcopy for anything else
+    """
+
+    value_type = type(value)
+    if value_type in _IMMUTABLE_SETTING_TYPES:
+        return value
+    elif value_type is dict:
+        return {key: _copy_setting_value(sub_value) for key, sub_value in value.items()}
+    elif value_type is list:
+        return [_copy_setting_value(sub_value) for sub_value in value]
+    elif value_type is tuple:
+        return tuple(_copy_setting_value(sub_value) for sub_value in value)
+
+    return copy.deepcopy(value)
+
+_TRUTHY_SETTINGS = frozenset(('#t', 't', 'true', '1', 'yes'))
+
+def _is_truthy_setting(value: object) -> bool:
+    """
+    Returns true if the prc setting value represents true
+    """
+
+    if isinstance(value, str):
+        return value.lower() in _TRUTHY_SETTINGS
+
+    return value == True
+
+_ENGINE_SETTING_FORMATTERS = {
+    bool: lambda value: '#t' if value else '#f',
+    tuple: _format_sequence_setting,
+    list: _format_sequence_setting
+}
+
 class InvalidEnvironmentConfig(RuntimeError):
     """
     Represents an invalid environment configuration
@@ -50,17 +98,36 @@ class ApplicationOptions(Configurable, InternalObject):
     """
 
     THREADING_MODELS = ['App/Cull/Draw', 'Cull/Draw', '/Draw', 'Cull']
-    PRC_VARIABLES = ['load-display', 'fullscreen', 'win-size', 'sync-video', 'show-frame-rate-meter']
+    PRC_VARIABLES = ('load-display', 'fullscreen', 'win-size', 'sync-video', 'show-frame-rate-meter')
     SUPPORTED_GRAPHICS_LIBRARIES = ConfigVariableList('gs-display')
     SUPPORTED_LANGUAGES = ConfigVariableList('gs-option-lang')
 
+    _PLATFORM_SETTERS = {
+        'darwin': 'set_darwin_options',
+        'win32': 'set_win32_options',
+        'linux': 'set_linux2_options',
+        'linux2': 'set_linux2_options'
+    }
+
+    _prc_cache = None
+
     def __init__(self, config_path, local_settings):
         Configurable.__init__(self, config_path, override_cache=RawOSConfigurableCache())
         InternalObject.__init__(self)
         self.local_settings = local_settings
         self.config_prc_settings = None
+        self._setting_cache = {}
+        self._pending_prc_lines = None
         self.__validate_environment()
 
+        # Snapshot the supported options for constant time validation
+        self._supported_displays = frozenset(self.SUPPORTED_GRAPHICS_LIBRARIES)
+        self._supported_languages = frozenset(self.SUPPORTED_LANGUAGES)
+
+        add_cache_listener = getattr(local_settings, 'add_cache_listener', None)
+        if add_cache_listener is not None:
+            add_cache_listener(self)
+
     def __validate_environment(self) -> None:
         """
         Validates the application environment to ensure its 
@@ -80,13 +147,19 @@ class ApplicationOptions(Configurable, InternalObject):
         """
 
         self.config_prc_settings = self.get_settings_from_prc(self.PRC_VARIABLES)
-        self.set_video_options()
-        self.set_interface_options()
-        self.__set_platform_specific_options()
 
-        if runtime.is_developer_build():
-            application_name = runtime.application.get_application_name()
-            self.set_engine_setting('pstats-name', '%s Performance Stats' % application_name)
+        # Collect the engine settings and submit them as a single prc page
+        self._pending_prc_lines = []
+        try:
+            self.set_video_options()
+            self.set_interface_options()
+            self.__set_platform_specific_options()
+
+            if runtime.is_developer_build():
+                application_name = runtime.application.get_application_name()
+                self.set_engine_setting('pstats-name', '%s Performance Stats' % application_name)
+        finally:
+            self.flush_engine_settings()
 
     def __set_platform_specific_options(self) -> None:
         """
@@ -94,10 +167,11 @@ class ApplicationOptions(Configurable, InternalObject):
         """
 
         platform_name = sys.platform
-        setter_name = 'set_%s_options' % platform_name
-        if hasattr(self, setter_name):
+        setter_name = self._PLATFORM_SETTERS.get(platform_name) or 'set_%s_options' % platform_name
+        setter = getattr(self, setter_name, None)
+        if setter is not None:
             self.notify.info('Setting platform options for: %s' % platform_name)
-            getattr(self, setter_name)()
+            setter()
         else:
             self.notify.warning('No platform options setter found for: %s' % platform_name)
 
@@ -157,19 +231,28 @@ class ApplicationOptions(Configurable, InternalObject):
             self.notify.warning('Attempting to set engine setting "%s" after ShowBase startup. Setting may not take effect' % (
                 key))
         
-        final = ''
-        if isinstance(value, bool):
-            final = '#t' if value else '#f'
-        elif isinstance(value, tuple) or isinstance(value, list):
-            parts = []
-            for v in value:
-                parts.append(str(v))
-            final = ' '.join(parts)
-        else:
-            final = value
-        
+        final = _ENGINE_SETTING_FORMATTERS.get(type(value), str)(value)
         self.notify.debug('Setting engine setting "%s" to "%s"' % (key, final))
-        load_prc_file_data('%s %s' % (key, final), 'application-setting')
+
+        line = '%s %s' % (key, final)
+        if self._pending_prc_lines is not None:
+            self._pending_prc_lines.append(line)
+            return
+
+        load_prc_file_data(line, 'application-setting')
+        ApplicationOptions._prc_cache = None
+
+    def flush_engine_settings(self) -> None:
+        """
+        Loads the engine settings collected while batching as a single
+        prc page and ends batching
+        """
+
+        lines = self._pending_prc_lines
+        self._pending_prc_lines = None
+        if lines:
+            load_prc_file_data('\n'.join(lines), 'application-setting')
+            ApplicationOptions._prc_cache = None
 
     def set_video_options(self) -> None:
         """
@@ -186,11 +269,8 @@ class ApplicationOptions(Configurable, InternalObject):
             display_default = self.config_prc_settings.get('load-display', '')
             display_default = display_default[5:] if display_default.startswith('panda') else None
             
-            sync_video_default = self.config_prc_settings.get('sync-video', 1)
-            sync_video_default = sync_video_default == True or sync_video_default == '#t' or sync_video_default == 't'
-
-            frame_rate_default = self.config_prc_settings.get('show-frame-rate-meter', False)
-            frame_rate_default = frame_rate_default == True or frame_rate_default == '#t' or frame_rate_default == 't'
+            sync_video_default = _is_truthy_setting(self.config_prc_settings.get('sync-video', 1))
+            frame_rate_default = _is_truthy_setting(self.config_prc_settings.get('show-frame-rate-meter', False))
             
             #TODO: load the rest of the defaults
 
@@ -220,7 +300,7 @@ class ApplicationOptions(Configurable, InternalObject):
         type provided in val_type
         """
 
-        return type(val) == val_type
+        return type(val) is val_type
 
     def _validate_threading_model(self, val: int) -> bool:
         """
@@ -236,14 +316,14 @@ class ApplicationOptions(Configurable, InternalObject):
         option
         """
 
-        return self._validate_value(val, self.SUPPORTED_GRAPHICS_LIBRARIES)
+        return val in self._supported_displays
 
     def _validate_language(self, val: str) -> bool:
         """
         Validates the value to ensure its a valid language option
         """
 
-        return self._validate_value(val, self.SUPPORTED_LANGUAGES)
+        return val in self._supported_languages
 
     def _validate_between_zero_and_one(self, val: int) -> bool:
         """
@@ -286,7 +366,37 @@ class ApplicationOptions(Configurable, InternalObject):
     def get_setting(self, setting_name: str, default_fallback: object = None, valdiation_callback: object = None) -> object:
         """
         Retrieves an application setting value and runs it against a validation
-        callback if present.
+        callback if present. Settings resolved from the local settings or the
+        configuration are cached per validation callback until the local
+        settings entry changes. Default fallbacks are never cached
+        """
+
+        cached = self._setting_cache.get(setting_name)
+        if cached is not None and valdiation_callback in cached:
+            return cached[valdiation_callback]
+
+        val, cacheable = self.__resolve_setting(setting_name, default_fallback, valdiation_callback)
+        if cacheable:
+            self._setting_cache.setdefault(setting_name, {})[valdiation_callback] = val
+
+        return val
+
+    def invalidate_setting(self, setting_name: str = None) -> None:
+        """
+        Removes the setting from the setting cache. Clears the entire
+        cache if no setting name is provided
+        """
+
+        if setting_name is None:
+            self._setting_cache.clear()
+        else:
+            self._setting_cache.pop(setting_name, None)
+
+    def __resolve_setting(self, setting_name: str, default_fallback: object, valdiation_callback: object) -> object:
+        """
+        Resolves the setting from the local settings, the application
+        configuration or the default fallback value. Returns the value and
+        true if the value is safe to cache
         """
 
         if setting_name in self.local_settings:
@@ -297,7 +407,7 @@ class ApplicationOptions(Configurable, InternalObject):
                 is_ok = valdiation_callback(val)
 
             if is_ok:
-                return val
+                return (val, True)
             else:
                 self.notify.warning('Invalid value %s for option %s found in application settings' % (
                     val, setting_name))
@@ -306,7 +416,7 @@ class ApplicationOptions(Configurable, InternalObject):
             ret = self.configuration.get(setting_name)
             self.local_settings[setting_name] = ret
 
-            return ret
+            return (ret, True)
 
         if default_fallback is not None:
             self.notify.info('Setting default setting for "%s": %s' % (setting_name, default_fallback))
@@ -315,22 +425,29 @@ class ApplicationOptions(Configurable, InternalObject):
         self.notify.warning('No default setting for "%s" specified in %s. Defaulting to %s' % (
             setting_name, self.path, default_fallback))
         
-        return default_fallback
+        return (default_fallback, False)
 
     def get_settings_from_prc(self, setting_name_list) -> dict:
         """
-        Retrieves the required settings from the Panda3D runtime config
+        Retrieves the required settings from the Panda3D runtime config. The
+        result is cached until an engine setting is changed
         """
 
+        setting_names = tuple(setting_name_list)
+        cache = ApplicationOptions._prc_cache
+        if cache is not None and cache[0] == setting_names:
+            return dict(cache[1])
+
         values = {}
-        for setting_name in setting_name_list:
+        for setting_name in setting_names:
             result = get_prc_value(setting_name, None)
             if result:
                 values[setting_name] = result
             else:
                 self.notify.warning('Failed to retrieve prc value for "%s"' % setting_name)
 
-        return values
+        ApplicationOptions._prc_cache = (setting_names, values)
+        return dict(values)
 
 class LocalSettings(dict, Configurable):
     """
@@ -342,12 +459,13 @@ class LocalSettings(dict, Configurable):
         self.__child_dicts = {}
         self.__first_time = True
         self.__dirty = False
+        self.__cache_listeners = weakref.WeakSet()
 
         if os.path.exists(config_path):
             self.__first_time = False
 
         Configurable.__init__(self, config_path, override_cache=RawOSConfigurableCache())
-        self.update(self.configuration)
+        dict.update(self, self.configuration)
         del self.configuration
     
     def is_first_time(self) -> bool:
@@ -365,30 +483,31 @@ class LocalSettings(dict, Configurable):
 
         return self.__dirty
 
-    def write(self) -> None:
+    def write(self, force: bool = False) -> None:
         """
-        Writes the application settings to file
+        Writes the application settings to file. Skipped when the settings
+        are unchanged and already on disk unless forced
         """
 
-        f = open(self.path, 'w')
-        f.write('[Configuration]\n')
+        if not force and not self.__dirty and os.path.exists(self.path):
+            return
 
-        for key, value in list(self.items()):
-            f.write('%s: %s\n' % (str(key), str(value)))
+        parts = ['[Configuration]\n']
+        parts.extend('%s: %s\n' % (key, value) for key, value in self.items())
 
-        for key, value in self.__child_dicts.items():
-            f.write('\n[%s]\n' % str(key))
-            if type(value) == dict:
-                for subKey, sub_value in value.items():
-                    if type(sub_value) == type(''):
-                        f.write("%s: '%s'\n" % (str(sub_key), str(sub_value.encode('utf8'))))
-                    elif type(subValue) == str:
-                        f.write("%s: '%s'\n" % (str(sub_key), str(sub_value)))
+        for section, values in self.__child_dicts.items():
+            parts.append('\n[%s]\n' % section)
+            if isinstance(values, dict):
+                for sub_key, sub_value in values.items():
+                    if isinstance(sub_value, str):
+                        parts.append("%s: '%s'\n" % (sub_key, sub_value))
                     else:
-                        f.write('%s: %s\n' % (str(sub_key), str(sub_value)))
+                        parts.append('%s: %s\n' % (sub_key, sub_value))
 
-        f.close()     
-        self.__dirty = False     
+        with open(self.path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(''.join(parts))
+
+        self.__dirty = False
 
     def load_data(self, section: str, data: dict) -> None:
         """
@@ -414,6 +533,14 @@ class LocalSettings(dict, Configurable):
         self.__first_time = True
         self.clear()
 
+    def add_cache_listener(self, listener: object) -> None:
+        """
+        Registers an object caching values from the local settings. The
+        listener's invalidate_setting is called when a setting changes
+        """
+
+        self.__cache_listeners.add(listener)
+
     def set_value_in_child_dict(self, child_dict_name: object, key: str, value: object) -> None:
         """
         """
@@ -421,6 +548,7 @@ class LocalSettings(dict, Configurable):
         temp_dict = self.__child_dicts.get(child_dict_name, {})
         temp_dict[key] = value
         self.__child_dicts[child_dict_name] = temp_dict
+        self.__dirty = True
 
     def get_value_in_child_dict(self, child_dict_name: object, key: str, value: object) -> None:
         """
@@ -432,13 +560,14 @@ class LocalSettings(dict, Configurable):
         """
         """
 
-        return copy.deepcopy(self.__child_dicts)
+        return _copy_setting_value(self.__child_dicts)
 
     def replace_child_dict(self, new_dict: dict) -> None:
         """
         """
 
         self.__child_dicts = dict(new_dict)
+        self.__dirty = True
 
     def on_setting_changed(self, key: str, new_value: object, old_value: object) -> None:
         """
@@ -449,13 +578,104 @@ class LocalSettings(dict, Configurable):
 
     def __setitem__(self, key: str, item: object) -> None:
         """
-        Custom item setter for calling on_setting_changed
+        Custom item setter for calling on_setting_changed. Unchanged
+        values are stored without flagging the settings as changed
         """
 
-        old_value = dict.get(self, key, None)
+        old_value = dict.get(self, key, _MISSING)
         dict.__setitem__(self, key, item)
+        if old_value is item or (old_value is not _MISSING and old_value == item):
+            return
+
+        if old_value is _MISSING:
+            old_value = None
+
         self.on_setting_changed(key, item, old_value)
 
+        self.__invalidate_listeners(key)
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Custom item deleter for calling on_setting_changed
+        """
+
+        old_value = dict.pop(self, key)
+        self.__on_setting_removed(key, old_value)
+
+    def pop(self, key: str, *default) -> object:
+        """
+        Removes and returns the setting value. Calls on_setting_changed
+        if the setting was present
+        """
+
+        if not dict.__contains__(self, key):
+            return dict.pop(self, key, *default)
+
+        old_value = dict.pop(self, key)
+        self.__on_setting_removed(key, old_value)
+
+        return old_value
+
+    def popitem(self) -> tuple:
+        """
+        Removes and returns a setting pair. Calls on_setting_changed
+        for the removed setting
+        """
+
+        key, old_value = dict.popitem(self)
+        self.__on_setting_removed(key, old_value)
+
+        return (key, old_value)
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the setting value, storing the default first if the
+        setting is not present
+        """
+
+        if not dict.__contains__(self, key):
+            self[key] = default
+
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Updates the settings through __setitem__ so changed values are
+        flagged and cached values are invalidated
+        """
+
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        """
+        Removes all settings and invalidates every cached setting
+        """
+
+        if not self:
+            return
+
+        dict.clear(self)
+        self.__dirty = True
+        self.__invalidate_listeners()
+
+    def __on_setting_removed(self, key: str, old_value: object) -> None:
+        """
+        Flags a removed setting as changed and invalidates its cached value
+        """
+
+        self.on_setting_changed(key, None, old_value)
+        self.__invalidate_listeners(key)
+
+    def __invalidate_listeners(self, key: str = None) -> None:
+        """
+        Invalidates the setting on every registered cache listener. Every
+        setting is invalidated if no key is provided
+        """
+
+        for listener in self.__cache_listeners:
+            listener.invalidate_setting(key)
+
 class SingletonLocalSettings(SingletonWrapper):
     """
     Singleton wrapper for the application local settings
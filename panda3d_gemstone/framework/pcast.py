@@ -23,6 +23,7 @@ SOFTWARE.
 """
 
 import io
+import re
 import tokenize
 
 from panda3d.core import Vec2, Vec3, Vec4
@@ -31,189 +32,251 @@ from panda3d.core import Point2, Point3, Point4
 from panda3d_gemstone.logging.utilities import get_notify_category
 
 __pcast_notify = get_notify_category('pcast')
+_SERIALIZE_RE = re.compile(r'(Vec|Point)[234]')
+_NUMBER_RE = re.compile(r'[+-]?(?:%s)' % tokenize.Number)
+_FAST_LITERALS = {'true': True, 'false': False, 'none': None, '#t': True, '#f': False}
+_NO_LITERAL = object()
 
-def __cast_scalar(token: object, name: str, src: object, scalar_types: object) -> object:
+def __cast_scalar(tokens: list, i: int, name: str, scalar_types: object) -> tuple:
     """
     """
 
-    if token[1].lower() == name:
-        token = next(src)
-        if token[1] == '(':
+    if tokens[i][1].lower() == name:
+        i += 1
+        if tokens[i][1] == '(':
             out = []
-            token = next(src)
-            while token[1] != ')':
-                out.append(__cast_number(token, src))
-                token = next(src)
-                if token[1] == ',':
-                    token = next(src)
+            i += 1
+            while tokens[i][1] != ')':
+                value, i = __cast_number(tokens, i)
+                out.append(value)
+                i += 1
+                if tokens[i][1] == ',':
+                    i += 1
 
             if len(out) in scalar_types:
-                return scalar_types[len(out)](*out)
+                return scalar_types[len(out)](*out), i
             else:
                 raise ValueError('Malformed scalar type (wrong number of elements)')
         else:
-            raise SyntaxError('Malformed expression %s' % str(token))
+            raise SyntaxError('Malformed expression %s' % str(tokens[i]))
 
-def __cast_vec(token: object, src: object) -> object:
+    return None, i
+
+def __cast_vec(tokens: list, i: int) -> tuple:
     """
     """
     
-    return __cast_scalar(token, 'vec', src, {
+    return __cast_scalar(tokens, i, 'vec', {
         2: Vec2,
         3: Vec3,
         4: Vec4
     })
 
-def __cast_point(token: object, src: object) -> object:
+def __cast_point(tokens: list, i: int) -> tuple:
     """
     """
 
-    return __cast_scalar(token, 'point', src, {
+    return __cast_scalar(tokens, i, 'point', {
         2: Point2,
         3: Point3,
         4: Point4
     })
 
-def __cast_dict(token: object, src: object) -> object:
+_NAME_CASTERS = {
+    'vec': __cast_vec,
+    'point': __cast_point,
+    'false': lambda tokens, i: (False, i),
+    'true': lambda tokens, i: (True, i),
+    'none': lambda tokens, i: (None, i)
+}
+
+def __cast_dict(tokens: list, i: int) -> tuple:
     """
     """
 
-    if token[1] == '{':
+    if tokens[i][1] == '{':
         out = {}
-        token = next(src)
-        while token[1] != '}':
-            key = __cast(token, src)
-            token = next(src)
-            if token[1] != ':':
+        i += 1
+        while tokens[i][1] != '}':
+            key, i = __cast(tokens, i)
+            i += 1
+            if tokens[i][1] != ':':
                 raise SyntaxError('malformed dictionary')
 
-            value = __cast(next(src), src)
+            value, i = __cast(tokens, i + 1)
             out[key] = value
-            token = next(src)
-            if token[1] == ',':
-                token = next(src)
+            i += 1
+            if tokens[i][1] == ',':
+                i += 1
 
-        return out
+        return out, i
 
-def __cast_sequence(token: object, src: object, start_token: str, end_token: str, seperator: str) -> object:
+    return None, i
+
+def __cast_sequence(tokens: list, i: int, start_token: str, end_token: str, seperator: str) -> tuple:
     """
     """
 
-    if token[1] == start_token:
+    if tokens[i][1] == start_token:
         out = []
-        token = next(src)
-        while token[1] != end_token:
-            out.append(__cast(token, src))
-            token = next(src)
-            if token[1] == end_yoken:
+        i += 1
+        while tokens[i][1] != end_token:
+            value, i = __cast(tokens, i)
+            out.append(value)
+            i += 1
+            if tokens[i][1] == end_token:
                 continue
-            if token[1] != seperator:
+            if tokens[i][1] != seperator:
                 raise SyntaxError('Malformed sequence')
-            token = next(src)
+            i += 1
+
+        return out, i
 
-        return out
+    return None, i
 
-def __castList(token: object, src: object) -> object:
-    return __cast_sequence(token, src, '[', ']', ',')
+def __cast_list(tokens: list, i: int) -> tuple:
+    """
+    """
 
-def __cast_tuple(token: object, src: object) -> object:
+    return __cast_sequence(tokens, i, '[', ']', ',')
+
+def __cast_tuple(tokens: list, i: int) -> tuple:
     """
     """
-    out = __cast_sequence(token, src, '(', ')', ',')
+    out, i = __cast_sequence(tokens, i, '(', ')', ',')
     if out is not None:
         out = tuple(out)
     
-    return out
+    return out, i
 
-def __castString(token, src):
+def __cast_string(tokens: list, i: int) -> tuple:
+    """
+    """
+
+    token = tokens[i]
     if token[0] == tokenize.STRING:
-        return str(token[1][1:-1])
+        return str(token[1][1:-1]), i
 
-def __cast_Name(token: object, src: object):
+    return None, i
+
+def __cast_name(tokens: list, i: int) -> tuple:
     """
     """
 
-    nameToCasterMapping = {
-        'vec': __castVec,
-        'point': __castPoint,
-        'false': lambda token, src: False,
-        'true': lambda token, src: True,
-        'none': lambda token, src: None
-    }
-
+    token = tokens[i]
     if token[0] == tokenize.NAME:
         name = token[1]
-        if name.lower() in name_to_caster_mapping:
-            return name_to_caster_mapping[name.lower()](token, src)
+        caster = _NAME_CASTERS.get(name.lower())
+        if caster is not None:
+            return caster(tokens, i)
         else:
-            return name
+            return name, i
 
-def __cast_number(token: object, src: object) -> int:
+    return None, i
+
+def __cast_number(tokens: list, i: int) -> tuple:
     """
     """
 
     sign = 1
+    end = i
+    token = tokens[end]
     if token[0] == tokenize.OP and token[1] == '+':
         sign = 1
-        token = next(src)
+        end += 1
+        token = tokens[end]
     elif token[0] == tokenize.OP and token[1] == '-':
         sign = -1
-        token = next(src)
+        end += 1
+        token = tokens[end]
     if token[0] == tokenize.NUMBER:
         try:
-            return sign * int(token[1], 0)
+            return sign * int(token[1], 0), end
         except ValueError:
-            return sign * float(token[1])
+            return sign * float(token[1]), end
+
+    return None, i
 
-def __cast(token: object, src: object) -> object:
+def __cast(tokens: list, i: int) -> tuple:
     """
+    Casts the value starting at tokens[i]. Returns the value and the
+    index of the last token it consumed
     """
 
-    out = __cast_dict(token, src)
+    out, end = __cast_dict(tokens, i)
     if out is not None:
-        return out
+        return out, end
 
-    out = __cast_kist(token, src)
+    out, end = __cast_list(tokens, i)
     if out is not None:
-        return out
+        return out, end
 
-    out = __cast_tuple(token, src)
+    out, end = __cast_tuple(tokens, i)
     if out is not None:
-        return out
+        return out, end
 
-    out = __cast_string(token, src)
+    out, end = __cast_string(tokens, i)
     if out is not None:
-        return out
+        return out, end
 
-    out = __cast_number(token, src)
+    out, end = __cast_number(tokens, i)
     if out is not None:
-        return out
+        return out, end
 
-    out = __cast_name(token, src)
+    return __cast_name(tokens, i)
 
-    return out
+def __cast_literal(txt: str) -> object:
+    """
+    Casts trivial literals without running the tokenizer. Returns
+    _NO_LITERAL when the text requires the full parser
+    """
+
+    lowered = txt.lower()
+    if lowered in _FAST_LITERALS:
+        return _FAST_LITERALS[lowered]
+
+    if _NUMBER_RE.fullmatch(txt):
+        try:
+            return int(txt, 0)
+        except ValueError:
+            pass
+
+        try:
+            return float(txt)
+        except ValueError:
+            return _NO_LITERAL
+
+    if txt.isidentifier() and lowered not in _NAME_CASTERS:
+        return txt
+
+    return _NO_LITERAL
 
 def cast(txt: str) -> object:
     if type(txt) in [str, str]:
         txt = txt.strip()
         if txt:
+            out = __cast_literal(txt)
+            if out is not _NO_LITERAL:
+                return out
+
             try:
-                src = io.StringIO(txt).readline
-                src = tokenize.generate_tokens(src)
-                out = __cast(next(src), src)
-                for token in src:
+                # Tokenize up front so the casters index into the list
+                # instead of resuming the tokenize generator
+                tokens = list(tokenize.generate_tokens(io.StringIO(txt).readline))
+                out, i = __cast(tokens, 0)
+                for token in tokens[i + 1:]:
                     if token[0] not in (tokenize.NEWLINE, tokenize.ENDMARKER):
                         raise SyntaxError('Malformed expression %s' % str(token))
 
                 return out
             except ValueError as msg:
-                __pcast_notify.error('Value Error (pcast): %s', msg)
+                __pcast_notify.error('Value Error (pcast): %s' % msg)
             except SyntaxError as msg:
-                __pcast_notify.error('Syntax Error (pcast): %s', msg)
-            except StopIteration:
+                __pcast_notify.error('Syntax Error (pcast): %s' % msg)
+            except IndexError:
                 raise SyntaxError('Malformed expression')
             except tokenize.TokenError as msg:
-                __pcast_notify.error('Syntax Error (pcast): %s', msg)
+                __pcast_notify.error('Syntax Error (pcast): %s' % msg)
 
     return None
 
@@ -221,17 +284,4 @@ def seralize(data: object) -> str:
     """
     """
 
-    replace_mapping = {
-        'Vec2': 'Vec',
-        'Vec3': 'Vec',
-        'Vec4': 'Vec',
-        'Point2': 'Point',
-        'Point3': 'Point',
-        'Point4': 'Point'
-    }
-
-    txt = str(data)
-    for key, value in list(replace_mapping.items()):
-        txt = txt.replace(key, value)
-
-    return txt
+    return _SERIALIZE_RE.sub(r'\1', str(data))
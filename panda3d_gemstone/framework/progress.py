@@ -31,6 +31,16 @@ class ProgressCounter(InternalObject):
     """
     """
 
+    __slots__ = ('_max', '_current')
+
+    # True while set_current only stores the value, letting increase and
+    # decrease store it directly instead of dispatching through set_current
+    _plain_set_current = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._plain_set_current = cls.set_current is ProgressCounter.set_current
+
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.start(*args, **kwargs)
@@ -118,14 +128,27 @@ class ProgressCounter(InternalObject):
         """
 
         current = self._current + value
-        self.set_current(min(current, self._max))
+        max_value = self._max
+        if current > max_value:
+            current = max_value
+
+        if self._plain_set_current:
+            self._current = current
+        else:
+            self.set_current(current)
 
     def decrease(self, value: float) -> None:
         """
         """
 
-        current = self._current + value
-        self.set_current(max(current, 0))
+        current = self._current - value
+        if current < 0:
+            current = 0
+
+        if self._plain_set_current:
+            self._current = current
+        else:
+            self.set_current(current)
 
     def tick(self) -> None:
         """
@@ -138,6 +161,17 @@ class ProgressController(ProgressCounter):
     """
     """
 
+    # Power of two minus one. When set, only one in every coarse_mask + 1
+    # changes queries the clock and may fire an update. The frame time read
+    # on that change is counted once for every change it stands in for
+    coarse_mask = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        mask = cls.coarse_mask
+        if mask < 0 or mask & (mask + 1):
+            raise ValueError('%s coarse_mask must be a power of two minus one: %s' % (cls.__name__, mask))
+
     @property
     def update_frequency(self) -> float:
         """
@@ -161,6 +195,25 @@ class ProgressController(ProgressCounter):
         ProgressCounter.start(self, max, current)
         self._update_frequency = update_frequency
         self._last_update = 0.0
+        self._tick_counter = 0
+        self._fire_update = self.__get_update_dispatch()
+
+    def __get_update_dispatch(self) -> object:
+        """
+        Returns a callable invoking update with the arguments its
+        signature accepts. Resolved once instead of on every change
+        """
+
+        update = self.update
+        args = len(inspect.getfullargspec(update)[0])
+        if args == 1:
+            return lambda current: update()
+        elif args == 2:
+            return update
+        elif args > 2:
+            return lambda current: update(current, self.get_max())
+
+        return lambda current: None
 
     def get_update_frequency(self) -> float:
         """
@@ -182,20 +235,17 @@ class ProgressController(ProgressCounter):
         """
 
         ProgressCounter.set_current(self, current)
-        dt = globalClock.get_dt()
 
-        self._last_update += dt
+        mask = self.coarse_mask
+        if mask:
+            self._tick_counter = (self._tick_counter + 1) & mask
+            if self._tick_counter:
+                return
+
+        self._last_update += globalClock.get_dt() * (mask + 1)
         if self._last_update > self._update_frequency:
             self._last_update = 0
-            
-            sig = inspect.getfullargspec(self.update)
-            args = len(sig[0])
-            if args == 1:
-                self.update()
-            elif args == 2:
-                self.update(current)
-            elif args > 2:
-                self.update(current. self.get_max())
+            self._fire_update(current)
 
     def update(self) -> None:
         """
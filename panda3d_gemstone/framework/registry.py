@@ -217,13 +217,12 @@ class ClassRegistry(Singleton, InternalObject):
         # to compare meta data. Returning all known
         # classes that match the query data
         for class_name in self._classes:
-            cls_name, module_name, module, meta = self._classes[class_name]
+            cls_name, module_name, module, class_meta = self._classes[class_name]
 
-            for meta_tag, meta_value in list(meta.items()):
-                if meta_tag in meta and meta[meta_tag] == meta_value:
-                    cls = self.get_class(class_name)
-                    if cls:
-                        classes.append(cls)
+            if all(meta_tag in class_meta and class_meta[meta_tag] == meta_value for meta_tag, meta_value in meta.items()):
+                cls = self.get_class(class_name)
+                if cls:
+                    classes.append(cls)
 
         return classes
 
@@ -25,6 +25,7 @@ SOFTWARE.
 from direct.task import Task
 
 from panda3d_gemstone.framework.utilities import create_task, remove_task
+from panda3d_gemstone.framework.utilities import is_awaitable_function
 from panda3d_gemstone.engine.performance import get_collector
 
 from panda3d.core import ConfigVariableBool
@@ -55,8 +56,13 @@ class Runnable(object):
         """
 
         if self.__task == None:
+            if is_awaitable_function(self.tick):
+                tick_func = self._do_tick
+            else:
+                tick_func = self._do_tick_sync
+
             self.__task = create_task(
-                self._do_tick, 
+                tick_func, 
                 priority=self.__priority,
                 task_chain_name=self.__task_chain_name)
 
@@ -103,4 +109,20 @@ class Runnable(object):
         if self.__collect.value:
             self.__collector.stop()
 
-        return Task.cont
\ No newline at end of file
+        return Task.cont
+
+    def _do_tick_sync(self, task: object) -> int:
+        """
+        Performs the task tick operation for runnable objects
+        with a synchronous tick handler
+        """
+
+        if self.__collect.value:
+            self.__collector.start()
+
+        self.tick(globalClock.get_dt())
+
+        if self.__collect.value:
+            self.__collector.stop()
+
+        return Task.cont
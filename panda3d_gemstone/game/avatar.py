@@ -24,7 +24,7 @@ SOFTWARE.
 
 from panda3d_gemstone.framework.configurable import Configurable
 from panda3d_gemstone.framework.runnable import Runnable
-from panda3d_gemstone.framework.controller import ControllerChainMixIn
+from panda3d_gemstone.framework.controller import ControllerChainMixIn, update_controller_chain
 from panda3d_gemstone.controllers.avatar import AvatarController
 from panda3d_gemstone.engine.model import AnimatedModel
 
@@ -178,9 +178,9 @@ class Avatar(AnimatedModel, Configurable, Runnable, ControllerChainMixIn):
         if not self.controller or not nodepath:
             return
         
-        np = await self.controller.update(nodepath, dt)
-        nodepath.set_quat(np.get_quat())
-        nodepath.set_fluid_pos(np.get_pos())
+        transform = await update_controller_chain(self.controller, nodepath, dt)
+        nodepath.set_quat(transform.get_quat())
+        nodepath.set_fluid_pos(transform.get_pos())
 
     async def tick(self, dt: float) -> None:
         """
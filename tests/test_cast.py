@@ -0,0 +1,63 @@
+"""
+MIT License
+
+Copyright (c) 2024 Jordan Maxwell
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+
+from panda3d_gemstone.framework import cast
+
+def _long_list(unbalanced: bool = False) -> str:
+    items = ['[%d,%d]' % (i, i + 1) for i in range(16)]
+    if unbalanced:
+        items[0] += ']'
+        items[-1] = '[' + items[-1]
+
+    return '[%s]' % ','.join(items)
+
+@pytest.fixture
+def character_split(monkeypatch):
+    monkeypatch.setattr(cast, '_get_numpy', lambda: None)
+    cast._cast_str.cache_clear()
+    yield
+    cast._cast_str.cache_clear()
+
+def test_vectorized_split_matches_character_split():
+    pytest.importorskip('numpy')
+    assert cast.cast(_long_list()) == [[i, i + 1] for i in range(16)]
+
+def test_character_split(character_split):
+    assert cast.cast(_long_list()) == [[i, i + 1] for i in range(16)]
+
+def test_vectorized_split_rejects_unbalanced_brackets():
+    pytest.importorskip('numpy')
+    with pytest.raises(IndexError):
+        cast.cast(_long_list(unbalanced=True))
+
+def test_character_split_rejects_unbalanced_brackets(character_split):
+    with pytest.raises(IndexError):
+        cast.cast(_long_list(unbalanced=True))
+
+def test_cached_results_are_copied():
+    first = cast.cast('[1,[2,3]]')
+    first[1].append(4)
+    assert cast.cast('[1,[2,3]]') == [1, [2, 3]]
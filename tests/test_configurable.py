@@ -0,0 +1,85 @@
+"""
+MIT License
+
+Copyright (c) 2024 Jordan Maxwell
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import configparser
+import os
+import pickle
+
+from panda3d.core import Filename
+
+from panda3d_gemstone.framework import configurable
+
+def _write_ini(path: str, text: str) -> str:
+    with open(path, 'w') as fh:
+        fh.write(text)
+
+    return Filename.from_os_specific(path).get_fullpath()
+
+def test_vfs_cache_reads_generated_dat_files(tmpdir):
+    path = _write_ini(str(tmpdir.join('settings.ini')), '[Configuration]\nvalue = 1\n')
+    assert configurable.OSConfigurableCache().write_cache_files([path]) == 1
+    assert os.path.exists(configurable.OSConfigurableCache.get_cache_filename(path))
+
+    reader = configurable.VFSConfigurableCache().read(path, None)
+    assert reader.get('Configuration', 'value') == '1'
+
+def test_vfs_cache_falls_back_to_legacy_dat_files(tmpdir):
+    path = _write_ini(str(tmpdir.join('legacy.ini')), '')
+    legacy = configparser.RawConfigParser()
+    legacy.read_dict({'Configuration': {'value': '2'}})
+    with open(os.path.splitext(path)[0] + '.dat', 'wb') as fh:
+        fh.write(pickle.dumps(legacy))
+
+    reader = configurable.VFSConfigurableCache().read(path, None)
+    assert reader.get('Configuration', 'value') == '2'
+
+def test_prefetch_reports_failed_reads(tmpdir, monkeypatch):
+    cache = configurable.RawOSConfigurableCache()
+    warnings = []
+    monkeypatch.setattr(cache.notify, 'warning', warnings.append)
+
+    def read(filepath, cls):
+        raise IOError('unreadable')
+
+    cache.read = read
+    cache.prefetch([str(tmpdir.join('missing.ini'))], None)
+    assert len(warnings) == 1 and 'unreadable' in warnings[0]
+
+def test_include_merge_leaves_cached_reader_unchanged(tmpdir):
+    base = _write_ini(str(tmpdir.join('base.ini')), '[Configuration]\nbase = 1\n\n[Extra]\nshared = 1\nonly_base = 1\n\n[Base]\nvalue = 1\n')
+    path = _write_ini(str(tmpdir.join('child.ini')), '[Configuration]\n__include__ = %s\nchild = 2\n\n[Extra]\nshared = 2\n' % base)
+    cache = configurable.RawOSConfigurableCache()
+
+    first = configurable.Configurable(path, override_cache=cache)
+    second = configurable.Configurable(path, override_cache=cache)
+
+    cached = cache.read(path, None)
+    assert cached.sections() == ['Configuration', 'Extra']
+    assert dict(cached.items('Extra')) == {'shared': '2'}
+
+    for loaded in (first, second):
+        assert loaded.configuration['base'] == 1
+        assert loaded.configuration['child'] == 2
+        assert dict(loaded.config.items('Extra')) == {'shared': '2', 'only_base': '1'}
+        assert loaded.config.has_section('Base')
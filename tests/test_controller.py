@@ -0,0 +1,166 @@
+"""
+MIT License
+
+Copyright (c) 2024 Jordan Maxwell
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import builtins
+
+import pytest
+
+from direct.task.TaskManagerGlobal import taskMgr
+from panda3d.core import AsyncFuture, ClockObject, LQuaternionf
+
+from panda3d_gemstone.engine import runtime
+from panda3d_gemstone.framework import controller
+
+def _changed(pos: tuple, quat: object, prev_pos: tuple, prev_quat: object) -> int:
+    return controller._transform_changed(*pos, *quat, *prev_pos, *prev_quat)
+
+def test_unchanged_transform_has_no_flags():
+    quat = LQuaternionf(1, 0, 0, 0)
+    assert _changed((1, 2, 3), quat, (1, 2, 3), quat) == 0
+
+def test_moved_and_turned_flags():
+    quat = LQuaternionf(1, 0, 0, 0)
+    turned = LQuaternionf()
+    turned.set_hpr((90, 0, 0))
+
+    assert _changed((1, 2, 3), quat, (1, 2, 4), quat) == controller._MOVED
+    assert _changed((1, 2, 3), turned, (1, 2, 3), quat) == controller._TURNED
+    assert _changed((0, 0, 0), turned, (1, 2, 3), quat) == controller._MOVED | controller._TURNED
+
+def test_negated_quaternion_is_not_turned():
+    quat = LQuaternionf()
+    quat.set_hpr((30, 45, 60))
+    assert _changed((0, 0, 0), quat, (0, 0, 0), -quat) == 0
+
+class _AsyncController(object):
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.future = AsyncFuture()
+
+    def is_async_chain(self) -> bool:
+        return True
+
+    async def update(self, nodepath: object, dt: float) -> object:
+        value = await self.future
+        if self.error is not None:
+            raise self.error
+
+        return (nodepath, value)
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(builtins, 'globalClock', ClockObject.get_global_clock(), raising=False)
+    monkeypatch.setattr(runtime, 'task_mgr', taskMgr, raising=False)
+    yield controller.ControllerScheduler()
+    controller.ControllerScheduler.reset_singleton()
+
+def _submit(controllers: list) -> list:
+    results = []
+
+    async def run(ctrl):
+        try:
+            results.append(await controller.update_controller_chain(ctrl, 'nodepath', 0.1))
+        except BaseException as e:
+            results.append(e)
+
+    for ctrl in controllers:
+        taskMgr.add(run(ctrl), 'controller-scheduler-test')
+
+    return results
+
+def test_scheduler_delivers_batched_results(scheduler):
+    controllers = [_AsyncController(), _AsyncController()]
+    results = _submit(controllers)
+    taskMgr.step()
+
+    for value, ctrl in enumerate(controllers):
+        ctrl.future.set_result(value)
+
+    taskMgr.step()
+    assert sorted(results) == [('nodepath', 0), ('nodepath', 1)]
+
+def test_scheduler_propagates_controller_errors(scheduler):
+    error = KeyError('controller')
+    controllers = [_AsyncController(error), _AsyncController()]
+    results = _submit(controllers)
+    taskMgr.step()
+
+    for ctrl in controllers:
+        ctrl.future.set_result(None)
+
+    taskMgr.step()
+    assert error in results
+    assert ('nodepath', None) in results
+
+def test_scheduler_destroy_cancels_queued_updates(scheduler):
+    results = _submit([_AsyncController()])
+    scheduler.deactivate()
+    taskMgr.step()
+
+    scheduler.destroy()
+    taskMgr.step()
+    assert len(results) == 1
+    assert results[0].__class__.__name__ == 'CancelledError'
+
+class _MoveController(controller.Controller):
+
+    def update_node_sync(self, nodepath: object, dt: float) -> object:
+        nodepath.set_x(nodepath.get_x() + 1)
+        return nodepath
+
+class _AsyncMoveController(_MoveController):
+
+    async def update_node(self, nodepath: object, dt: float) -> object:
+        return self.update_node_sync(nodepath, dt)
+
+def _drive(coroutine: object) -> object:
+    try:
+        coroutine.send(None)
+    except StopIteration as e:
+        return e.value
+
+    raise AssertionError('Controller update suspended')
+
+def test_sync_chain_returns_pooled_scratch(monkeypatch):
+    monkeypatch.setattr(controller, '_scratch_pool', [])
+    chain = _MoveController(None, _MoveController(None))
+    nodepath = controller.NodePath('target')
+
+    transform = chain.update_sync(nodepath, 0.1)
+    assert transform.get_pos().x == 2
+    assert nodepath.get_x() == 0
+    assert chain.has_changed()
+    assert len(controller._scratch_pool) == 1
+
+    chain.update_sync(nodepath, 0.1)
+    assert len(controller._scratch_pool) == 1
+
+def test_async_chain_returns_pooled_scratch(monkeypatch):
+    monkeypatch.setattr(controller, '_scratch_pool', [])
+    chain = _AsyncMoveController(None, _AsyncMoveController(None))
+
+    transform = _drive(chain.update(controller.NodePath('target'), 0.1))
+    assert transform.get_pos().x == 2
+    assert len(controller._scratch_pool) == 1
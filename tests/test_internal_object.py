@@ -0,0 +1,51 @@
+"""
+MIT License
+
+Copyright (c) 2024 Jordan Maxwell
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from direct.directnotify.DirectNotifyGlobal import directNotify
+
+from panda3d_gemstone.framework.internal_object import InternalObject
+
+def test_subclasses_resolve_their_own_notifier():
+    class ParentObject(InternalObject):
+        pass
+
+    parent_notify = ParentObject().notify
+
+    class ChildObject(ParentObject):
+        pass
+
+    child_notify = ChildObject().notify
+    assert child_notify is not parent_notify
+    assert ChildObject().get_notify_name() == 'child-object'
+
+def test_subclasses_inherit_explicit_notifiers():
+    explicit = directNotify.newCategory('explicit-parent')
+
+    class ExplicitParent(InternalObject):
+        notify = explicit
+
+    class ExplicitChild(ExplicitParent):
+        pass
+
+    assert ExplicitChild().notify is explicit
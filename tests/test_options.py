@@ -0,0 +1,112 @@
+"""
+MIT License
+
+Copyright (c) 2024 Jordan Maxwell
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+
+from panda3d_gemstone.framework.options import ApplicationOptions, LocalSettings
+
+def _make_settings(tmpdir, text: str = None) -> LocalSettings:
+    path = str(tmpdir.join('settings.ini'))
+    if text is not None:
+        with open(path, 'w') as fh:
+            fh.write(text)
+
+    return LocalSettings(path)
+
+def _make_options(local_settings: LocalSettings, configuration: dict = None) -> ApplicationOptions:
+    options = ApplicationOptions.__new__(ApplicationOptions)
+    options.path = 'options.ini'
+    options.configuration = configuration or {}
+    options.local_settings = local_settings
+    options._setting_cache = {}
+    local_settings.add_cache_listener(options)
+
+    return options
+
+def test_loaded_settings_are_not_dirty(tmpdir):
+    settings = _make_settings(tmpdir, '[Configuration]\nvolume: 0.5\n')
+    assert settings['volume'] == 0.5
+    assert not settings.is_dirty()
+
+def test_changed_settings_are_written(tmpdir):
+    settings = _make_settings(tmpdir, '[Configuration]\nvolume: 0.5\n')
+    settings['volume'] = 0.5
+    assert not settings.is_dirty()
+
+    settings['volume'] = 0.25
+    assert settings.is_dirty()
+
+    settings.write()
+    assert not settings.is_dirty()
+    assert _make_settings(tmpdir)['volume'] == 0.25
+
+def test_unchanged_settings_skip_writing(tmpdir):
+    settings = _make_settings(tmpdir, '[Configuration]\nvolume: 0.5\n')
+    path = settings.path
+    os.remove(path)
+    settings.write()
+    assert os.path.exists(path)
+
+    os.utime(path, (0, 0))
+    settings.write()
+    assert os.path.getmtime(path) == 0
+
+def test_removing_settings_marks_dirty(tmpdir):
+    for remove in (lambda s: s.pop('volume'), lambda s: s.popitem(), lambda s: s.clear(), lambda s: s.__delitem__('volume')):
+        settings = _make_settings(tmpdir, '[Configuration]\nvolume: 0.5\n')
+        remove(settings)
+        assert 'volume' not in settings
+        assert settings.is_dirty()
+
+def test_get_setting_is_cached_per_validator(tmpdir):
+    options = _make_options(_make_settings(tmpdir, '[Configuration]\nvolume: 2.0\n'))
+    assert options.get_setting('volume', 1.0) == 2.0
+    assert options.get_setting('volume', 1.0, lambda value: value <= 1.0) == 1.0
+
+def test_get_setting_does_not_cache_defaults(tmpdir):
+    options = _make_options(_make_settings(tmpdir))
+    assert options.get_setting('missing') is None
+    assert options.get_setting('missing', 3) == 3
+    assert options._setting_cache == {}
+
+def test_get_setting_is_invalidated_by_local_changes(tmpdir):
+    settings = _make_settings(tmpdir, '[Configuration]\nvolume: 0.5\n')
+    options = _make_options(settings)
+    assert options.get_setting('volume') == 0.5
+
+    settings['volume'] = 0.25
+    assert options.get_setting('volume') == 0.25
+
+    settings.update(volume=0.75)
+    assert options.get_setting('volume') == 0.75
+
+    del settings['volume']
+    assert options.get_setting('volume', 0.1) == 0.1
+
+    settings.pop('volume')
+    settings.setdefault('volume', 0.2)
+    assert options.get_setting('volume') == 0.2
+
+    settings.clear()
+    assert options.get_setting('volume') is None
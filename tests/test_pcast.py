@@ -0,0 +1,69 @@
+"""
+MIT License
+
+Copyright (c) 2024 Jordan Maxwell
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+
+from panda3d_gemstone.framework import pcast
+
+_LITERALS = ['10', '-3', '+2.5', '1e5', '0x1F', '1_000', '.5', '5.', '00', '-0.0', 'true', 'None', 'name']
+_MALFORMED = ['010', '1e', '1.2.3']
+
+def _disable_fast_path(monkeypatch):
+    monkeypatch.setitem(vars(pcast), '__cast_literal', lambda txt: pcast._NO_LITERAL)
+
+@pytest.mark.parametrize('value', _LITERALS)
+def test_literal_fast_path_matches_tokenizer(value, monkeypatch):
+    fast = pcast.cast(value)
+    _disable_fast_path(monkeypatch)
+    slow = pcast.cast(value)
+
+    assert fast == slow
+    assert type(fast) is type(slow)
+
+@pytest.mark.parametrize('value', _MALFORMED)
+def test_malformed_numbers_raise(value, monkeypatch):
+    with pytest.raises(Exception):
+        pcast.cast(value)
+
+    _disable_fast_path(monkeypatch)
+    with pytest.raises(Exception):
+        pcast.cast(value)
+
+def test_structured_values():
+    assert pcast.cast('[1, 2, [3]]') == [1, 2, [3]]
+    assert pcast.cast('(1, "two")') == (1, 'two')
+    assert pcast.cast("{'a': 1, 'b': [2]}") == {'a': 1, 'b': [2]}
+    assert pcast.cast('vec(1, 2, 3)') == pcast.Vec3(1, 2, 3)
+    assert pcast.cast('point(1, 2)') == pcast.Point2(1, 2)
+
+def test_malformed_sequences_raise():
+    with pytest.raises(Exception):
+        pcast.cast('[1 2]')
+
+def test_unmatched_sign_raises():
+    with pytest.raises(Exception):
+        pcast.cast('-abc')
+
+    with pytest.raises(Exception):
+        pcast.cast('[-abc]')
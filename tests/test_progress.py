@@ -0,0 +1,84 @@
+"""
+MIT License
+
+Copyright (c) 2024 Jordan Maxwell
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import builtins
+
+import pytest
+
+from panda3d_gemstone.framework.progress import ProgressCounter, ProgressController
+
+class _FixedClock(object):
+
+    def __init__(self, dt: float):
+        self.dt = dt
+        self.calls = 0
+
+    def get_dt(self) -> float:
+        self.calls += 1
+        return self.dt
+
+class _CoarseController(ProgressController):
+    coarse_mask = 3
+
+    def update(self, current: float) -> None:
+        self.updates.append(current)
+
+def test_coarse_mask_counts_time_for_skipped_changes(monkeypatch):
+    monkeypatch.setattr(builtins, 'globalClock', _FixedClock(0.25), raising=False)
+    controller = _CoarseController(10, 0, update_frequency=0.9)
+    controller.updates = []
+
+    for current in range(1, 9):
+        controller.set_current(current)
+
+    assert controller.updates == [4, 8]
+
+def test_coarse_mask_skips_the_clock_on_masked_changes(monkeypatch):
+    clock = _FixedClock(0.0)
+    monkeypatch.setattr(builtins, 'globalClock', clock, raising=False)
+    controller = _CoarseController(10, 0, update_frequency=1.0)
+    controller.updates = []
+
+    for current in range(1, 9):
+        controller.set_current(current)
+
+    assert clock.calls == 2
+
+def test_coarse_mask_must_be_power_of_two_minus_one():
+    with pytest.raises(ValueError):
+        class _InvalidController(ProgressController):
+            coarse_mask = 6
+
+def test_counter_decrease_subtracts_and_clamps():
+    counter = ProgressCounter(10, 5)
+    counter.decrease(2)
+    assert counter.current == 3
+
+    counter.decrease(5)
+    assert counter.current == 0
+
+def test_counter_increase_clamps_to_max():
+    counter = ProgressCounter(10, 5)
+    counter.increase(8)
+    assert counter.current == 10
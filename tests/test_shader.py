@@ -0,0 +1,51 @@
+"""
+MIT License
+
+Copyright (c) 2024 Jordan Maxwell
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+
+from panda3d_gemstone.engine import shader
+
+def test_load_shader_rejects_mixed_vertex_fragment_languages():
+    with pytest.raises(shader.MalformedShaderLoadRequest):
+        shader.load_shader('shader.glsl', 'shader.cg')
+
+def test_load_shader_rejects_mixed_optional_stage_languages():
+    with pytest.raises(shader.MalformedShaderLoadRequest):
+        shader.load_shader('shader.glsl', 'shader.glsl', geometry='shader.cg')
+
+def test_load_shader_rejects_unsupported_extension():
+    with pytest.raises(shader.MalformedShaderLoadRequest):
+        shader.load_shader('shader.txt', 'shader.txt')
+
+def test_make_compute_shader_passes_a_single_source():
+    body = '#version 430\nlayout(local_size_x = 1) in;\nvoid main() {}\n'
+    assert shader.make_compute_shader(shader.Shader.SL_GLSL, body) is not None
+
+def test_load_compute_shader_raises_on_compile_failure(tmpdir):
+    with pytest.raises(shader.ShaderCompileError):
+        shader.load_compute_shader(str(tmpdir.join('missing.glsl')))
+
+def test_load_compute_shader_rejects_unsupported_extension():
+    with pytest.raises(shader.MalformedShaderLoadRequest):
+        shader.load_compute_shader('shader.txt')
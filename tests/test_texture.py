@@ -0,0 +1,48 @@
+"""
+MIT License
+
+Copyright (c) 2024 Jordan Maxwell
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import gc
+import weakref
+
+from panda3d_gemstone.engine.texture import TextureBuffer
+
+def test_buffer_proxies_pnm_image_methods():
+    buffer = TextureBuffer(4, 4)
+    buffer.fill(0.2)
+
+    assert buffer.get_x_size() == 4
+    assert abs(buffer.get_gray(0, 0) - 0.2) < 0.01
+
+def test_proxied_buffers_are_freed_without_the_cycle_collector():
+    buffer = TextureBuffer(4, 4)
+    buffer.fill(0.5)
+    buffer.get_gray(0, 0)
+    ref = weakref.ref(buffer)
+
+    gc.disable()
+    try:
+        del buffer
+        assert ref() is None
+    finally:
+        gc.enable()